@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Attendance Structured-Array Backend
+Simpan metrik kehadiran dalam NumPy structured array (nama, ID, dan departemen
+di-intern ke pool string dan disimpan sebagai indeks) sehingga total, rata-rata,
+statistik per departemen, dan top-k overtime dihitung secara vektor
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from hr_text_analysis import load_attendance_sections
+
+LOG_FILE = '../hr/hr_attendance_log.txt'
+
+# Batas nilai mengikuti tipe kolom: jam <= 65535, hari/kali <= 255 (cukup untuk log bulanan).
+# Nilai di luar batas ditolak dengan ValueError saat membangun array.
+ATTENDANCE_DTYPE = np.dtype([
+    ('employee', np.uint32),      # indeks nama di AttendanceArray.strings
+    ('employee_id', np.uint32),   # indeks ID di AttendanceArray.strings
+    ('department', np.uint16),    # indeks ke AttendanceArray.departments
+    ('total_hours', np.uint16),
+    ('overtime_hours', np.uint16),
+    ('days_present', np.uint8),
+    ('days_absent', np.uint8),
+    ('late_arrivals', np.uint8),
+    ('early_departures', np.uint8)
+])
+METRICS = ['total_hours', 'overtime_hours', 'days_present', 'days_absent',
+           'late_arrivals', 'early_departures']
+METRIC_LIMITS = {metric: int(np.iinfo(ATTENDANCE_DTYPE[metric]).max) for metric in METRICS}
+
+class StringPool:
+    """Pool string ter-intern: string yang sama disimpan sekali sebagai UTF-8 dalam satu buffer
+
+    Selama build, dict string -> indeks dipakai untuk deduplikasi; setelah freeze()
+    hanya tersisa buffer bytes dan array offset uint32 (tanpa objek str per karyawan).
+    """
+
+    def __init__(self):
+        self._index = {}
+        self._chunks = []
+        self._offsets = [0]
+        self.buffer = b''
+        self.offsets = np.zeros(1, dtype=np.uint32)
+
+    def intern(self, text):
+        """Indeks string di pool; string baru ditambahkan sekali"""
+        index = self._index.get(text)
+        if index is None:
+            encoded = text.encode('utf-8')
+            index = self._index[text] = len(self._offsets) - 1
+            self._chunks.append(encoded)
+            self._offsets.append(self._offsets[-1] + len(encoded))
+        return index
+
+    def freeze(self):
+        """Gabungkan chunk ke satu buffer dan buang dict build-time"""
+        self.buffer = b''.join(self._chunks)
+        self.offsets = np.asarray(self._offsets, dtype=np.uint32)
+        self._index, self._chunks, self._offsets = {}, [], [0]
+
+    def __getitem__(self, index):
+        return self.buffer[self.offsets[index]:self.offsets[index + 1]].decode('utf-8')
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def nbytes(self):
+        """Ukuran buffer + array offset"""
+        return len(self.buffer) + self.offsets.nbytes
+
+class AttendanceArray:
+    """Metrik kehadiran per karyawan dalam satu structured array + pool string"""
+
+    def __init__(self, employees=()):
+        self.strings = StringPool()
+        self.departments = []
+        self._department_index = {}
+        self.records = np.fromiter((self._row(emp) for emp in employees), dtype=ATTENDANCE_DTYPE)
+        self.strings.freeze()
+
+    def _intern_department(self, department):
+        """Indeks departemen di pool; departemen baru ditambahkan sekali"""
+        index = self._department_index.get(department)
+        if index is None:
+            index = self._department_index[department] = len(self.departments)
+            self.departments.append(department)
+        return index
+
+    def _row(self, emp):
+        """Konversi dict hasil load_attendance_sections() ke tuple baris (dengan cek batas kolom)"""
+        for metric in METRICS:
+            if not 0 <= emp[metric] <= METRIC_LIMITS[metric]:
+                raise ValueError(f"{metric}={emp[metric]} untuk {emp['name']} di luar batas "
+                                 f"kolom (0..{METRIC_LIMITS[metric]})")
+        return (self.strings.intern(emp['name']), self.strings.intern(emp.get('id') or ''),
+                self._intern_department(emp['department']),
+                *(emp[metric] for metric in METRICS))
+
+    @classmethod
+    def from_log(cls, log_file=LOG_FILE):
+        """Parse log kehadiran langsung ke structured array"""
+        return cls(load_attendance_sections(log_file))
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def nbytes(self):
+        """Ukuran structured array + pool string + nama departemen"""
+        return (self.records.nbytes + self.strings.nbytes +
+                sum(len(d.encode('utf-8')) for d in self.departments))
+
+    def totals(self):
+        """Total setiap metrik (akumulasi int64 agar tidak overflow)"""
+        return {metric: int(self.records[metric].sum(dtype=np.int64)) for metric in METRICS}
+
+    def means(self):
+        """Rata-rata setiap metrik per karyawan"""
+        if not len(self):
+            return {metric: 0.0 for metric in METRICS}
+        return {metric: float(self.records[metric].mean(dtype=np.float64)) for metric in METRICS}
+
+    def department_stats(self, metric='overtime_hours'):
+        """Jumlah karyawan, total, dan rata-rata metrik per departemen (bincount)"""
+        dept = self.records['department']
+        counts = np.bincount(dept, minlength=len(self.departments))
+        sums = np.bincount(dept, weights=self.records[metric], minlength=len(self.departments))
+        return {name: {'employees': int(counts[i]), 'total': float(sums[i]),
+                       'mean': float(sums[i] / counts[i]) if counts[i] else 0.0}
+                for i, name in enumerate(self.departments)}
+
+    def top_k(self, metric='overtime_hours', k=3):
+        """Indeks baris dengan nilai metrik terbesar: argpartition O(n), lalu sort k baris saja"""
+        values = self.records[metric]
+        k = min(k, len(values))
+        if k == 0:
+            return np.empty(0, dtype=np.intp)
+        top = np.argpartition(values, len(values) - k)[-k:]
+        return top[np.argsort(values[top], kind='stable')[::-1]]
+
+    def where(self, metric, minimum=1):
+        """Indeks baris dengan metrik >= minimum (misalnya karyawan yang pernah terlambat)"""
+        return np.flatnonzero(self.records[metric] >= minimum)
+
+    def name(self, row):
+        """Nama karyawan pada baris tertentu"""
+        return self.strings[self.records['employee'][row]]
+
+    def employee_id(self, row):
+        """Employee ID pada baris tertentu"""
+        return self.strings[self.records['employee_id'][row]]
+
+    def department(self, row):
+        """Departemen karyawan pada baris tertentu"""
+        return self.departments[self.records['department'][row]]
+
+def analyze_attendance_array(log_file=LOG_FILE):
+    """Tampilkan ringkasan kehadiran yang setara parse_attendance_log(), dari structured array"""
+    print("=== ANALISIS LOG KEHADIRAN (STRUCTURED ARRAY) ===")
+
+    table = AttendanceArray.from_log(log_file)
+    print(f"Total karyawan dalam log: {len(table)}")
+    if not len(table):
+        return table
+
+    totals, means = table.totals(), table.means()
+    print(f"\nTotal jam kerja: {totals['total_hours']} jam")
+    print(f"Total overtime: {totals['overtime_hours']} jam")
+    print(f"Rata-rata jam kerja per karyawan: {means['total_hours']:.1f} jam")
+    print(f"Rata-rata overtime per karyawan: {means['overtime_hours']:.1f} jam")
+
+    print(f"\nKaryawan dengan overtime tertinggi:")
+    for row in table.top_k('overtime_hours', 3):
+        print(f"- {table.name(row)} ({table.department(row)}): {table.records['overtime_hours'][row]} jam")
+
+    late = table.where('late_arrivals')
+    if len(late):
+        print(f"\nKaryawan dengan keterlambatan: {len(late)}")
+        for row in late:
+            print(f"- {table.name(row)}: {table.records['late_arrivals'][row]} kali")
+
+    print("\nOvertime per departemen:")
+    for department, stats in table.department_stats().items():
+        print(f"- {department}: {stats['total']:.0f} jam ({stats['employees']} karyawan)")
+
+    return table
+
+def benchmark(size=200_000, seed=0):
+    """Bandingkan memori dan waktu list of dict vs structured array"""
+    print(f"=== BENCHMARK STRUCTURED ARRAY: {size:,} karyawan ===")
+    rng = np.random.default_rng(seed)
+    departments = ['Engineering', 'Marketing', 'Human Resources', 'Finance', 'Customer Support']
+    overtime = rng.integers(0, 40, size=size)
+    late = rng.integers(0, 5, size=size)
+    dept = rng.integers(0, len(departments), size=size)
+
+    tracemalloc.start()
+    employees = [{'id': f"EMP{i:06d}", 'name': f"Karyawan {i}", 'department': departments[dept[i]],
+                  'total_hours': 160 + int(overtime[i]), 'overtime_hours': int(overtime[i]),
+                  'days_present': 22, 'days_absent': 0, 'late_arrivals': int(late[i]),
+                  'early_departures': 0} for i in range(size)]
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+
+    # Memori tabel diukur tracemalloc juga (array + pool nama/ID + departemen), bukan hanya records
+    table = AttendanceArray(employees)
+    table_bytes = tracemalloc.get_traced_memory()[0] - dict_bytes
+    tracemalloc.stop()
+
+    per_dict = dict_bytes / size
+    per_row = table_bytes / size
+    print(f"Memori list of dict: {dict_bytes / 1e6:,.1f} MB ({per_dict:.0f} bytes/karyawan)")
+    print(f"Memori structured array + pool string: {table_bytes / 1e6:,.1f} MB "
+          f"({per_row:.0f} bytes/karyawan, {per_dict / per_row:.1f}x lebih kecil)")
+    print(f"  - records: {table.records.nbytes / 1e6:,.1f} MB, "
+          f"pool nama/ID: {table.strings.nbytes / 1e6:,.1f} MB")
+
+    clock = time.perf_counter()
+    sum(e['total_hours'] for e in employees), sum(e['overtime_hours'] for e in employees)
+    sorted(employees, key=lambda x: x['overtime_hours'], reverse=True)[:3]
+    dict_time = time.perf_counter() - clock
+
+    clock = time.perf_counter()
+    table.totals(), table.top_k('overtime_hours', 3), table.department_stats()
+    array_time = time.perf_counter() - clock
+
+    print(f"Total + top-3 (list of dict, sum + sorted): {dict_time * 1000:.1f} ms")
+    print(f"Total + top-3 + stats departemen (array): {array_time * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Structured-array backend untuk metrik kehadiran")
+    parser.add_argument('--benchmark', type=int, nargs='?', const=200_000,
+                        help="Benchmark memori/waktu pada N karyawan sintetis (default 200k)")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+    else:
+        analyze_attendance_array()
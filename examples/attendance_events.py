@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Attendance Event Time-Series
+Ekstrak setiap event keterlambatan dan pulang cepat dari log kehadiran ke tabel
+kolumnar (pandas dengan dtype bertipe) untuk analisis tren lintas bulan/tahun
+"""
+
+import re
+import sys
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+LOG_FILE = '../hr/hr_attendance_log.txt'
+
+EVENT_KINDS = {'Late Arrivals:': 'late', 'Early Departures:': 'early'}
+MONTHS = {name: i for i, name in enumerate(
+    ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'], 1)}
+
+EVENT_PATTERN = re.compile(
+    r'([A-Z][a-z]{2})[a-z]*\.?\s+(\d{1,2}):\s*(\d+)\s*(minutes?|mins?|hours?|hrs?)\b')
+COUNT_PATTERN = re.compile(r':\s*(\d+)\s+times?\b')
+EMPLOYEE_PATTERN = re.compile(r'EMPLOYEE:\s*([^(]+?)\s*(?:\((\w+)\))?\s*$')
+YEAR_PATTERN = re.compile(r'\b((?:19|20)\d{2})\b')
+
+def parse_event_line(line):
+    """Parse baris 'Late Arrivals: 2 times (Jan 8: 15 mins, ...)' menjadi list (bulan, hari, menit, alasan)
+
+    Detail dipecah per koma; alasan setelah ' - ' hanya berlaku untuk event yang
+    diikutinya. Potongan tanpa event dianggap lanjutan alasan yang mengandung koma.
+    """
+    if '(' not in line:
+        return []
+
+    detail = line[line.index('(') + 1:line.rindex(')') if ')' in line else len(line)]
+    events = []
+    for part in detail.split(','):
+        text, separator, reason = part.partition(' - ')
+        match = EVENT_PATTERN.search(text)
+        if match is None:
+            if events and events[-1][3] is not None:
+                events[-1][3] += ',' + part.rstrip()
+            continue
+
+        month, day, amount, unit = match.groups()
+        if month not in MONTHS:
+            continue
+        minutes = int(amount) * (60 if unit.startswith('h') else 1)
+        events.append([MONTHS[month], int(day), minutes, reason.strip() if separator else None])
+    return [tuple(event) for event in events]
+
+def parse_attendance_events(content, year=None):
+    """Parse semua event dari satu isi log; tahun diambil dari header jika tidak diberikan
+
+    Event dengan tanggal tidak valid (misalnya Feb 29 di tahun non-kabisat) dilewati,
+    dan jumlah event yang ter-parse dicek terhadap 'N times' di baris; keduanya
+    dilaporkan sebagai peringatan tanpa menggagalkan seluruh log.
+    """
+    if year is None:
+        match = YEAR_PATTERN.search(content[:500])
+        year = int(match.group(1)) if match else date.today().year
+
+    columns = {'employee_id': [], 'name': [], 'department': [], 'date': [],
+               'minutes': [], 'kind': [], 'reason': []}
+
+    for section in content.split('=' * 40):
+        if 'EMPLOYEE:' not in section or 'Department:' not in section:
+            continue
+
+        name = employee_id = department = None
+        events = []
+        for line in section.strip().split('\n'):
+            line = line.strip()
+            if line.startswith('EMPLOYEE:'):
+                match = EMPLOYEE_PATTERN.search(line)
+                if match:
+                    name, employee_id = match.group(1), match.group(2)
+            elif line.startswith('Department:'):
+                department = line.split(':')[1].strip()
+            else:
+                for prefix, kind in EVENT_KINDS.items():
+                    if line.startswith(prefix):
+                        parsed = parse_event_line(line)
+                        count = COUNT_PATTERN.search(line)
+                        if count and int(count.group(1)) != len(parsed):
+                            print(f"Peringatan: {name} - {prefix} tercatat {count.group(1)} kali, "
+                                  f"{len(parsed)} event berhasil di-parse: {line}")
+                        events.extend((kind, event) for event in parsed)
+
+        for kind, (month, day, minutes, reason) in events:
+            try:
+                date(year, month, day)
+            except ValueError:
+                print(f"Peringatan: tanggal tidak valid {year:04d}-{month:02d}-{day:02d} "
+                      f"untuk {name}, event dilewati")
+                continue
+            columns['employee_id'].append(employee_id or name)
+            columns['name'].append(name)
+            columns['department'].append(department)
+            columns['date'].append(f"{year:04d}-{month:02d}-{day:02d}")
+            columns['minutes'].append(minutes)
+            columns['kind'].append(kind)
+            columns['reason'].append(reason)
+
+    return columns
+
+def events_frame(columns):
+    """Bangun DataFrame kolumnar: kolom teks berulang sebagai category, tanggal datetime64, menit int32"""
+    return pd.DataFrame({
+        'employee_id': pd.Categorical(columns['employee_id']),
+        'name': pd.Categorical(columns['name']),
+        'department': pd.Categorical(columns['department']),
+        'date': np.array(columns['date'], dtype='datetime64[D]').astype('datetime64[ns]'),
+        'minutes': np.array(columns['minutes'], dtype=np.int32),
+        'kind': pd.Categorical(columns['kind'], categories=sorted(set(EVENT_KINDS.values()))),
+        'reason': pd.Categorical(columns['reason'])
+    })
+
+def load_attendance_events(log_files=(LOG_FILE,)):
+    """Load event dari satu atau banyak file log (misalnya satu file per bulan)"""
+    merged = {}
+    for log_file in log_files:
+        with open(log_file, 'r', encoding='utf-8') as f:
+            columns = parse_attendance_events(f.read())
+        for key, values in columns.items():
+            merged.setdefault(key, []).extend(values)
+
+    if not merged:
+        merged = parse_attendance_events('')
+    return events_frame(merged).sort_values('date', kind='stable').reset_index(drop=True)
+
+def weekly_minutes_by_department(events, kind='late'):
+    """Total menit per minggu per departemen (tabel departemen x minggu)"""
+    selected = events[events['kind'] == kind]
+    weekly = selected.groupby(['department', pd.Grouper(key='date', freq='W-MON', label='left', closed='left')],
+                              observed=True)['minutes'].sum()
+    return weekly.unstack('date', fill_value=0)
+
+def rolling_event_counts(events, kind='late', window='30D'):
+    """Jumlah event per karyawan dalam jendela waktu bergulir (default 30 hari)"""
+    selected = events[events['kind'] == kind].sort_values(['employee_id', 'date'])
+    counts = (selected.set_index('date')
+              .groupby('employee_id', observed=True)['minutes']
+              .rolling(window).count()
+              .astype(np.int32))
+    return counts.rename('rolling_count').reset_index()
+
+def analyze_attendance_events(log_files=(LOG_FILE,)):
+    """Tampilkan ringkasan tren keterlambatan dan pulang cepat"""
+    print("=== ANALISIS EVENT KEHADIRAN ===")
+
+    events = load_attendance_events(log_files)
+    print(f"Total event: {len(events)}")
+    print(f"Memori tabel event: {events.memory_usage(deep=True).sum():,} bytes")
+
+    summary = events.groupby('kind', observed=True)['minutes'].agg(['count', 'sum', 'mean'])
+    print("\nRingkasan per jenis event:")
+    for kind, data in summary.iterrows():
+        print(f"- {kind}: {data['count']:.0f} kali, total {data['sum']:.0f} menit, rata-rata {data['mean']:.1f} menit")
+
+    weekly = weekly_minutes_by_department(events)
+    if not weekly.empty:
+        print("\nMenit terlambat per minggu per departemen:")
+        for department, row in weekly.iterrows():
+            weeks = ', '.join(f"{week:%d %b}: {minutes}" for week, minutes in row.items() if minutes)
+            print(f"- {department}: {weeks}")
+
+    rolling = rolling_event_counts(events)
+    if not rolling.empty:
+        peak = rolling.loc[rolling.groupby('employee_id', observed=True)['rolling_count'].idxmax()]
+        print("\nPuncak keterlambatan dalam 30 hari bergulir:")
+        for _, row in peak.iterrows():
+            print(f"- {row['employee_id']}: {row['rolling_count']} kali (s.d. {row['date']:%Y-%m-%d})")
+
+    return events
+
+if __name__ == "__main__":
+    # Bisa diberi beberapa file log sekaligus, misalnya satu file per bulan
+    analyze_attendance_events(sys.argv[1:] or (LOG_FILE,))
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Incremental Attendance Log Processing
+Proses log kehadiran yang terus di-append: hanya section baru sejak watermark
+(byte offset) terakhir yang di-parse, agregat per karyawan disimpan di SQLite
+(key: employee ID) sehingga setiap run hanya membaca/menulis karyawan yang berubah
+"""
+
+import heapq
+import json
+import os
+import sqlite3
+import sys
+
+from hr_text_analysis import parse_attendance_sections
+
+LOG_FILE = '../hr/hr_attendance_log.txt'
+STATE_FILE = 'attendance_state.db'
+SEPARATOR = ('=' * 40).encode('utf-8')
+SUMMED_FIELDS = ['total_hours', 'overtime_hours', 'days_present', 'days_absent',
+                 'late_arrivals', 'early_departures']
+TOP_OVERTIME = 3
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS employees (
+    employee_key TEXT PRIMARY KEY, name TEXT, department TEXT,
+    {', '.join(f'{field} INTEGER' for field in SUMMED_FIELDS)},
+    late_order INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_employees_late ON employees(late_order) WHERE late_order IS NOT NULL;
+"""
+
+def empty_state():
+    """State awal: watermark di awal file dan agregat kosong
+
+    Hanya ringkasan berukuran tetap (watermark, total, top-k) yang disimpan di
+    sini; agregat per karyawan ada di tabel employees.
+    """
+    return {
+        'offset': 0,
+        'fingerprint': None,
+        'employee_count': 0,
+        'late_count': 0,
+        'totals': {field: 0 for field in SUMMED_FIELDS},
+        'top_overtime': []
+    }
+
+def connect(state_file=STATE_FILE):
+    """Buka (atau buat) database state dengan row sebagai sqlite3.Row"""
+    conn = sqlite3.connect(state_file)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    return conn
+
+def load_state(conn):
+    """Baca ringkasan state, atau state kosong jika belum ada"""
+    row = conn.execute("SELECT value FROM meta WHERE key = 'state'").fetchone()
+    return json.loads(row['value']) if row else empty_state()
+
+def save_state(conn, state):
+    """Simpan ringkasan state lalu commit (satu transaksi bersama update karyawan)"""
+    conn.execute("INSERT OR REPLACE INTO meta VALUES ('state', ?)", (json.dumps(state),))
+    conn.commit()
+
+def reset_state(conn, state):
+    """Kosongkan agregat (file log dirotasi atau dipotong)"""
+    conn.execute("DELETE FROM employees")
+    state.clear()
+    state.update(empty_state())
+
+def _fingerprint(f):
+    """Ambil header file untuk mendeteksi file yang diganti (bukan di-append)"""
+    f.seek(0)
+    return f.read(len(SEPARATOR) * 2).hex()
+
+def read_new_sections(conn, log_file, state, flush=False):
+    """Baca section lengkap setelah watermark; kembalikan (teks, offset baru)
+
+    Section dianggap lengkap jika sudah diikuti separator. Sisa data setelah
+    separator terakhir ditunda sampai run berikutnya, kecuali flush=True.
+    """
+    with open(log_file, 'rb') as f:
+        fingerprint = _fingerprint(f)
+        size = f.seek(0, os.SEEK_END)
+
+        stored = state['fingerprint'] or ''
+        if not fingerprint.startswith(stored) or size < state['offset']:
+            # File dirotasi atau dipotong: mulai ulang dari awal
+            reset_state(conn, state)
+        state['fingerprint'] = fingerprint
+
+        f.seek(state['offset'])
+        data = f.read()
+
+    if flush:
+        consumed = len(data)
+    else:
+        last_separator = data.rfind(SEPARATOR)
+        if last_separator < 0:
+            return '', state['offset']
+        consumed = last_separator + len(SEPARATOR)
+
+    return data[:consumed].decode('utf-8'), state['offset'] + consumed
+
+def get_employees(conn, keys):
+    """Ambil baris karyawan untuk key tertentu saja (lookup PRIMARY KEY)"""
+    keys = list(keys)
+    if not keys:
+        return {}
+    rows = conn.execute(f"SELECT * FROM employees WHERE employee_key IN ({','.join('?' * len(keys))})",
+                        keys)
+    return {row['employee_key']: dict(row) for row in rows}
+
+def apply_sections(conn, state, text):
+    """Update agregat hanya untuk karyawan yang muncul di section baru (key: employee ID)"""
+    updates = {}
+    for parsed in parse_attendance_sections(text):
+        key = parsed['id'] or parsed['name']
+        current = updates.setdefault(key, {field: 0 for field in SUMMED_FIELDS})
+        current['name'] = parsed['name']
+        current['department'] = parsed['department']
+        for field in SUMMED_FIELDS:
+            current[field] += parsed[field]
+            state['totals'][field] += parsed[field]
+
+    # Hanya top-k lama + karyawan yang berubah yang dibaca dari database
+    employees = get_employees(conn, set(updates) | set(state['top_overtime']))
+    for key, update in updates.items():
+        current = employees.get(key)
+        if current is None:
+            current = employees[key] = {'employee_key': key, 'late_order': None,
+                                        **{field: 0 for field in SUMMED_FIELDS}}
+            state['employee_count'] += 1
+        current['name'] = update['name']
+        current['department'] = update['department']
+        for field in SUMMED_FIELDS:
+            current[field] += update[field]
+        if current['late_order'] is None and current['late_arrivals'] > 0:
+            current['late_order'] = state['late_count']
+            state['late_count'] += 1
+
+    columns = ['employee_key', 'name', 'department', *SUMMED_FIELDS, 'late_order']
+    conn.executemany(
+        f"INSERT OR REPLACE INTO employees ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+        ([employees[key][column] for column in columns] for key in updates))
+
+    # Overtime hanya bertambah, jadi top-k baru cukup dipilih dari top-k lama + karyawan yang berubah
+    state['top_overtime'] = heapq.nlargest(
+        TOP_OVERTIME, employees, key=lambda n: (employees[n]['overtime_hours'], n))
+
+    return list(updates)
+
+def late_employees(conn):
+    """Karyawan yang pernah terlambat, urut saat pertama kali tercatat terlambat (pakai indeks)"""
+    return [dict(row) for row in conn.execute(
+        "SELECT * FROM employees WHERE late_order IS NOT NULL ORDER BY late_order")]
+
+def process_incremental(conn, log_file=LOG_FILE, flush=False):
+    """Proses data baru sejak watermark dan simpan state"""
+    state = load_state(conn)
+    text, new_offset = read_new_sections(conn, log_file, state, flush=flush)
+    touched = apply_sections(conn, state, text)
+    state['offset'] = new_offset
+    save_state(conn, state)
+    return state, touched
+
+def report_incremental(log_file=LOG_FILE, state_file=STATE_FILE, flush=False):
+    """Tampilkan ringkasan kehadiran dari agregat inkremental"""
+    print("=== ANALISIS LOG KEHADIRAN (INKREMENTAL) ===")
+
+    conn = connect(state_file)
+    state, touched = process_incremental(conn, log_file, flush=flush)
+    totals = state['totals']
+    count = state['employee_count']
+
+    print(f"Watermark: byte {state['offset']:,}")
+    print(f"Karyawan diperbarui pada run ini: {len(touched)}")
+    print(f"Total karyawan dalam log: {count}")
+
+    if count:
+        print(f"\nTotal jam kerja: {totals['total_hours']} jam")
+        print(f"Total overtime: {totals['overtime_hours']} jam")
+        print(f"Rata-rata jam kerja per karyawan: {totals['total_hours']/count:.1f} jam")
+        print(f"Rata-rata overtime per karyawan: {totals['overtime_hours']/count:.1f} jam")
+
+        print(f"\nKaryawan dengan overtime tertinggi:")
+        top = get_employees(conn, state['top_overtime'])
+        for key in state['top_overtime']:
+            print(f"- {top[key]['name']} ({top[key]['department']}): {top[key]['overtime_hours']} jam")
+
+        if state['late_count']:
+            print(f"\nKaryawan dengan keterlambatan: {state['late_count']}")
+            for emp in late_employees(conn):
+                print(f"- {emp['name']}: {emp['late_arrivals']} kali")
+
+    conn.close()
+    return state
+
+if __name__ == "__main__":
+    # Gunakan --flush untuk ikut memproses section terakhir yang belum ditutup separator
+    report_incremental(flush='--flush' in sys.argv[1:])
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Disease Feature Matrix Export
+Ekspor katalog penyakit (healthcare/*.json) menjadi matriks sparse CSR
+penyakit x ciri fisik dan penyakit x lokasi, disimpan sebagai file .npy mentah
+per shard agar bisa di-load zero-copy (mmap) oleh job training tanpa parse JSON
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+
+from sign_clustering import DATASETS, normalize_sign
+
+OUTPUT_DIR = 'disease_features'
+MATRICES = ['signs', 'locations']
+CSR_PARTS = ['indptr', 'indices', 'data']
+INDEX_DTYPE = np.int32
+# Suffix ciri_fisik_<region> yang merupakan lokasi anatomis (ciri_fisik_umum bukan lokasi)
+BODY_REGIONS = {'wajah', 'tubuh', 'mata', 'lidah', 'mulut', 'kulit'}
+
+def disease_features(disease):
+    """Ambil fitur satu penyakit: ciri fisik (ternormalisasi) dan lokasi
+
+    Lokasi berasal dari 'lokasi_predileksi' ditambah region tubuh pada nama
+    field ciri_fisik_* (misalnya ciri_fisik_wajah -> 'wajah'), hanya untuk
+    region di BODY_REGIONS.
+    """
+    signs, locations = [], []
+    for field, value in disease.items():
+        if not isinstance(value, list):
+            continue
+        if field.startswith('ciri_fisik') or field == 'ciri_visual':
+            signs.extend(normalize_sign(sign) for sign in value if isinstance(sign, str))
+            region = field[len('ciri_fisik_'):] if field.startswith('ciri_fisik_') else None
+            if region in BODY_REGIONS and value:
+                locations.append(region)
+        elif field == 'lokasi_predileksi':
+            locations.extend(normalize_sign(loc) for loc in value if isinstance(loc, str))
+    return signs, locations
+
+def iter_diseases(datasets=DATASETS):
+    """Iterasi (katalog, penyakit) dari semua file dataset"""
+    for category, file_path in datasets.items():
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for disease in json.load(f):
+                yield category, disease
+
+class _CsrBuilder:
+    """Kumpulkan baris CSR biner untuk satu shard dengan vocabulary global append-only"""
+
+    def __init__(self, vocabulary):
+        self.vocabulary = vocabulary
+        self.indptr = [0]
+        self.indices = []
+
+    def add_row(self, terms):
+        """Tambah satu baris biner; term baru mendapat kolom berikutnya di vocabulary"""
+        columns = {self.vocabulary.setdefault(term, len(self.vocabulary)) for term in terms}
+        self.indices.extend(sorted(columns))
+        self.indptr.append(len(self.indices))
+
+    def save(self, shard_dir, name):
+        """Simpan indptr/indices/data sebagai .npy terpisah; kembalikan nnz"""
+        if len(self.indices) >= np.iinfo(INDEX_DTYPE).max:
+            raise ValueError(f"shard terlalu besar untuk indeks {INDEX_DTYPE.__name__}, kecilkan shard_size")
+        arrays = {
+            'indptr': np.asarray(self.indptr, dtype=INDEX_DTYPE),
+            'indices': np.asarray(self.indices, dtype=INDEX_DTYPE),
+            'data': np.ones(len(self.indices), dtype=np.float32)
+        }
+        for part, array in arrays.items():
+            np.save(os.path.join(shard_dir, f"{name}_{part}.npy"), array)
+        return len(self.indices)
+
+def export_features(output_dir=OUTPUT_DIR, shard_size=100_000, diseases=None):
+    """Ekspor semua penyakit ke shard CSR + file vocabulary + manifest.json"""
+    os.makedirs(output_dir, exist_ok=True)
+    vocabularies = {name: {} for name in MATRICES}
+    manifest = {'format': 'csr-npy', 'index_dtype': np.dtype(INDEX_DTYPE).name,
+                'matrices': MATRICES, 'shards': []}
+
+    def flush(start, row, builders):
+        """Tulis shard untuk baris [start, row)"""
+        shard_dir = f"shard_{len(manifest['shards']):05d}"
+        os.makedirs(os.path.join(output_dir, shard_dir), exist_ok=True)
+        nnz = {name: builder.save(os.path.join(output_dir, shard_dir), name)
+               for name, builder in builders.items()}
+        manifest['shards'].append({'path': shard_dir, 'rows': [start, row], 'nnz': nnz})
+
+    start = row = 0
+    builders = {name: _CsrBuilder(vocabularies[name]) for name in MATRICES}
+    with open(os.path.join(output_dir, 'diseases.tsv'), 'w', encoding='utf-8') as rows:
+        rows.write("row\tcatalogue\tid\tnama_penyakit\tkategori\n")
+        for catalogue, disease in (diseases if diseases is not None else iter_diseases()):
+            signs, locations = disease_features(disease)
+            builders['signs'].add_row(signs)
+            builders['locations'].add_row(locations)
+            rows.write(f"{row}\t{catalogue}\t{disease['id']}\t{disease['nama_penyakit']}\t"
+                       f"{disease.get('kategori', '')}\n")
+            row += 1
+
+            if row - start == shard_size:
+                flush(start, row, builders)
+                start = row
+                builders = {name: _CsrBuilder(vocabularies[name]) for name in MATRICES}
+
+    if row > start or not manifest['shards']:
+        flush(start, row, builders)
+
+    # Vocabulary ditulis setelah semua shard selesai: jumlah kolom final = ukuran vocabulary
+    for name, vocabulary in vocabularies.items():
+        with open(os.path.join(output_dir, f"vocab_{name}.txt"), 'w', encoding='utf-8') as f:
+            f.writelines(f"{term}\n" for term in vocabulary)
+
+    manifest['n_rows'] = row
+    manifest['n_columns'] = {name: len(vocabulary) for name, vocabulary in vocabularies.items()}
+    with open(os.path.join(output_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+def load_manifest(output_dir=OUTPUT_DIR):
+    """Baca manifest hasil ekspor"""
+    with open(os.path.join(output_dir, 'manifest.json'), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def load_shard(output_dir, shard, matrix='signs', manifest=None, mmap=True):
+    """Load satu shard CSR; dengan mmap=True array dipetakan langsung dari disk (zero-copy)
+
+    Mengembalikan scipy.sparse.csr_matrix jika scipy tersedia, selain itu
+    tuple (data, indices, indptr, shape).
+    """
+    manifest = manifest or load_manifest(output_dir)
+    info = manifest['shards'][shard]
+    shard_dir = os.path.join(output_dir, info['path'])
+    arrays = {part: np.load(os.path.join(shard_dir, f"{matrix}_{part}.npy"),
+                            mmap_mode='r' if mmap else None) for part in CSR_PARTS}
+    shape = (info['rows'][1] - info['rows'][0], manifest['n_columns'][matrix])
+
+    try:
+        from scipy.sparse import csr_matrix
+    except ImportError:
+        return arrays['data'], arrays['indices'], arrays['indptr'], shape
+    return csr_matrix((arrays['data'], arrays['indices'], arrays['indptr']), shape=shape, copy=False)
+
+def iter_shards(output_dir=OUTPUT_DIR, matrix='signs', mmap=True):
+    """Iterasi (baris_awal, matriks shard) untuk training per batch"""
+    manifest = load_manifest(output_dir)
+    for shard, info in enumerate(manifest['shards']):
+        yield info['rows'][0], load_shard(output_dir, shard, matrix, manifest, mmap)
+
+def load_vocabulary(output_dir=OUTPUT_DIR, matrix='signs'):
+    """Vocabulary kolom: list term, indeks list = indeks kolom"""
+    with open(os.path.join(output_dir, f"vocab_{matrix}.txt"), 'r', encoding='utf-8') as f:
+        return f.read().splitlines()
+
+def report_export(output_dir=OUTPUT_DIR, shard_size=100_000):
+    """Ekspor fitur dan tampilkan ringkasannya"""
+    print("=== EKSPOR FITUR PENYAKIT (CSR) ===")
+
+    manifest = export_features(output_dir, shard_size)
+    print(f"Output: {output_dir}/ ({len(manifest['shards'])} shard)")
+    print(f"Jumlah penyakit (baris): {manifest['n_rows']}")
+    for name in MATRICES:
+        nnz = sum(shard['nnz'][name] for shard in manifest['shards'])
+        columns = manifest['n_columns'][name]
+        density = nnz / (manifest['n_rows'] * columns) if manifest['n_rows'] and columns else 0
+        print(f"- {name}: {columns} kolom, {nnz} nilai non-zero (density {density:.2%})")
+
+    matrix = load_shard(output_dir, 0, 'signs', manifest)
+    # Tanpa scipy, load_shard mengembalikan tuple (data, indices, indptr, shape)
+    shape = matrix[3] if isinstance(matrix, tuple) else matrix.shape
+    print(f"\nContoh load shard 0 (mmap): shape {shape}")
+    return manifest
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ekspor katalog penyakit ke matriks sparse CSR")
+    parser.add_argument('--output', default=OUTPUT_DIR)
+    parser.add_argument('--shard-size', type=int, default=100_000, help="Jumlah penyakit per shard")
+    args = parser.parse_args()
+
+    report_export(args.output, args.shard_size)
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Similar Disease Search
+Indeks TF-IDF (matriks sparse) atas deskripsi_singkat + semua ciri_fisik_*
+untuk mencari penyakit paling mirip lintas katalog (cosine top-k), dengan
+query batch dan indeks yang bisa disimpan/di-load ulang
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+
+import numpy as np
+from scipy import sparse
+
+from disease_features import iter_diseases
+from sign_clustering import DATASETS
+
+INDEX_DIR = 'disease_similarity_index'
+TOKEN_PATTERN = re.compile(r'[^\W\d_]{3,}')
+STOP_WORDS = {'yang', 'dan', 'atau', 'pada', 'dengan', 'untuk', 'dari', 'dalam', 'akibat',
+              'oleh', 'sebagai', 'dapat', 'tidak', 'lebih', 'sangat', 'serta', 'karena',
+              'menyebabkan', 'adanya', 'biasanya', 'the', 'and', 'with'}
+
+def disease_document(disease):
+    """Gabungkan deskripsi_singkat dan semua ciri_fisik_* menjadi satu dokumen"""
+    parts = [disease.get('deskripsi_singkat', '')]
+    for field, value in disease.items():
+        if (field.startswith('ciri_fisik') or field == 'ciri_visual') and isinstance(value, list):
+            parts.extend(item for item in value if isinstance(item, str))
+    return ' '.join(parts)
+
+def tokenize(text):
+    """Token kata huruf (>= 3 karakter), lowercase, tanpa stop words"""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOP_WORDS]
+
+class SimilarityIndex:
+    """Matriks TF-IDF ter-normalisasi L2 (CSR, dokumen x term) + metadata penyakit
+
+    Karena setiap baris sudah ber-norma 1, cosine similarity = hasil kali
+    sparse Q @ X.T, lalu top-k per baris dipilih dengan argpartition.
+    """
+
+    def __init__(self, matrix, idf, vocabulary, diseases, sources=None):
+        self.matrix = matrix
+        self.idf = idf
+        self.vocabulary = vocabulary
+        self.diseases = diseases
+        self.sources = sources
+        self._matrix_t = None
+        self._rows_by_name = {}
+        for row, (catalogue, name) in enumerate(diseases):
+            self._rows_by_name.setdefault(name, row)
+
+    @classmethod
+    def build(cls, records):
+        """Bangun indeks dari iterable (katalog, dict penyakit)"""
+        vocabulary = {}
+        indptr, indices, diseases = [0], [], []
+        for catalogue, disease in records:
+            indices.extend(vocabulary.setdefault(token, len(vocabulary))
+                           for token in tokenize(disease_document(disease)))
+            indptr.append(len(indices))
+            diseases.append((catalogue, disease['nama_penyakit']))
+
+        n_docs = len(diseases)
+        counts = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), np.asarray(indices, dtype=np.int32),
+             np.asarray(indptr, dtype=np.int64)), shape=(n_docs, len(vocabulary)))
+        counts.sum_duplicates()
+
+        document_frequency = np.bincount(counts.indices, minlength=len(vocabulary))
+        idf = (np.log((1 + n_docs) / (1 + document_frequency)) + 1).astype(np.float32)
+        return cls(cls._weight(counts, idf), idf, vocabulary, diseases)
+
+    @staticmethod
+    def _weight(counts, idf):
+        """TF sublinear (1 + log tf) x IDF, lalu normalisasi L2 per baris"""
+        weighted = counts.copy()
+        weighted.data = (1 + np.log(weighted.data)) * idf[weighted.indices]
+        norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+        norms[norms == 0] = 1
+        weighted.data /= np.repeat(norms, np.diff(weighted.indptr)).astype(np.float32)
+        return weighted
+
+    def vectorize(self, texts):
+        """Ubah teks bebas menjadi baris TF-IDF dengan vocabulary indeks (term baru diabaikan)"""
+        indptr, indices = [0], []
+        for text in texts:
+            indices.extend(self.vocabulary[t] for t in tokenize(text) if t in self.vocabulary)
+            indptr.append(len(indices))
+        counts = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), np.asarray(indices, dtype=np.int32),
+             np.asarray(indptr, dtype=np.int64)), shape=(len(texts), len(self.vocabulary)))
+        counts.sum_duplicates()
+        return self._weight(counts, self.idf)
+
+    def row(self, name):
+        """Baris indeks untuk nama penyakit"""
+        if name not in self._rows_by_name:
+            raise KeyError(f"penyakit tidak ditemukan: {name}")
+        return self._rows_by_name[name]
+
+    def search(self, queries, k=5, exclude_rows=None, block_size=256):
+        """Top-k cosine untuk setiap baris query (CSR); diproses per blok agar memori terbatas
+
+        Mengembalikan (rows, scores) berukuran (n_query x k), urut skor menurun.
+        exclude_rows (opsional): satu baris per query yang tidak boleh ikut hasil (dirinya sendiri).
+        """
+        n_docs = self.matrix.shape[0]
+        k = min(k, n_docs - (1 if exclude_rows is not None else 0))
+        all_rows = np.empty((queries.shape[0], k), dtype=np.int64)
+        all_scores = np.empty((queries.shape[0], k), dtype=np.float32)
+        if k <= 0:
+            return all_rows, all_scores
+
+        if self._matrix_t is None:
+            # Transpose CSR (term x dokumen) dihitung sekali dan dipakai ulang oleh semua query
+            self._matrix_t = self.matrix.T.tocsr()
+        for start in range(0, queries.shape[0], block_size):
+            block = queries[start:start + block_size]
+            scores = (block @ self._matrix_t).toarray()
+            if exclude_rows is not None:
+                scores[np.arange(block.shape[0]), exclude_rows[start:start + block.shape[0]]] = -np.inf
+
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind='stable')
+            all_rows[start:start + block.shape[0]] = np.take_along_axis(top, order, axis=1)
+            all_scores[start:start + block.shape[0]] = np.take_along_axis(top_scores, order, axis=1)
+        return all_rows, all_scores
+
+    def similar_to(self, names, k=5):
+        """Penyakit paling mirip untuk satu atau banyak nama penyakit (batch)"""
+        single = isinstance(names, str)
+        rows = np.array([self.row(name) for name in ([names] if single else names)], dtype=np.int64)
+        results = self._results(*self.search(self.matrix[rows], k, exclude_rows=rows))
+        return results[0] if single else results
+
+    def query_text(self, texts, k=5):
+        """Penyakit paling mirip untuk teks bebas (misalnya kumpulan ciri fisik pasien)"""
+        single = isinstance(texts, str)
+        results = self._results(*self.search(self.vectorize([texts] if single else texts), k))
+        return results[0] if single else results
+
+    def _results(self, top_rows, top_scores):
+        """List (katalog, nama, skor) per query; skor <= 0 dibuang sehingga hasil bisa kurang dari k"""
+        return [[(*self.diseases[r], float(s)) for r, s in zip(rs, ss) if s > 0]
+                for rs, ss in zip(top_rows, top_scores)]
+
+    def save(self, index_dir=INDEX_DIR):
+        """Simpan matriks (.npz), IDF (.npy), vocabulary dan metadata (JSON)"""
+        os.makedirs(index_dir, exist_ok=True)
+        sparse.save_npz(os.path.join(index_dir, 'tfidf.npz'), self.matrix)
+        np.save(os.path.join(index_dir, 'idf.npy'), self.idf)
+        with open(os.path.join(index_dir, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump({'vocabulary': list(self.vocabulary), 'diseases': self.diseases,
+                       'sources': self.sources}, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, index_dir=INDEX_DIR):
+        """Load indeks yang sudah disimpan tanpa membaca ulang JSON penyakit"""
+        matrix = sparse.load_npz(os.path.join(index_dir, 'tfidf.npz')).tocsr()
+        idf = np.load(os.path.join(index_dir, 'idf.npy'))
+        with open(os.path.join(index_dir, 'meta.json'), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        vocabulary = {term: i for i, term in enumerate(meta['vocabulary'])}
+        return cls(matrix, idf, vocabulary, [tuple(d) for d in meta['diseases']], meta.get('sources'))
+
+def source_versions(datasets=DATASETS):
+    """Versi file sumber: [mtime_ns, ukuran] per path, untuk mendeteksi indeks yang basi"""
+    versions = {}
+    for file_path in datasets.values():
+        stat = os.stat(file_path)
+        versions[file_path] = [stat.st_mtime_ns, stat.st_size]
+    return versions
+
+def load_or_build_index(index_dir=INDEX_DIR, rebuild=False):
+    """Load indeks tersimpan, atau bangun dari healthcare/*.json lalu simpan
+
+    Indeks tersimpan dibangun ulang jika mtime/ukuran salah satu file sumber berubah.
+    """
+    sources = source_versions()
+    if not rebuild and os.path.exists(os.path.join(index_dir, 'tfidf.npz')):
+        index = SimilarityIndex.load(index_dir)
+        if index.sources == sources:
+            return index
+    index = SimilarityIndex.build(iter_diseases())
+    index.sources = sources
+    index.save(index_dir)
+    return index
+
+def report_similar_diseases(names=None, k=5, rebuild=False):
+    """Tampilkan penyakit paling mirip untuk beberapa contoh penyakit"""
+    print("=== PENYAKIT PALING MIRIP (TF-IDF COSINE) ===")
+
+    index = load_or_build_index(rebuild=rebuild)
+    print(f"Indeks: {index.matrix.shape[0]} penyakit, {len(index.vocabulary)} term")
+
+    names = names or [name for _, name in index.diseases[::7]]
+    for name, results in zip(names, index.similar_to(names, k)):
+        print(f"\nMirip dengan '{name}':")
+        for catalogue, other, score in results:
+            print(f"  - [{catalogue}] {other}: {score:.3f}")
+
+    return index
+
+def synthetic_records(size, seed=0):
+    """Penyakit sintetis: campuran kalimat dari dokumen asli agar distribusi term realistis"""
+    rng = np.random.default_rng(seed)
+    sentences = []
+    for _, disease in iter_diseases():
+        sentences.append(disease.get('deskripsi_singkat', ''))
+        sentences.extend(s for f, v in disease.items()
+                         if f.startswith('ciri_fisik') and isinstance(v, list) for s in v)
+    picks = rng.integers(0, len(sentences), size=(size, 8))
+    for i in range(size):
+        yield 'sintetis', {'nama_penyakit': f"penyakit_{i}",
+                           'deskripsi_singkat': ' '.join(sentences[j] for j in picks[i])}
+
+def benchmark(size=100_000, k=10, queries=1000):
+    """Benchmark build, query tunggal, dan query batch"""
+    print(f"=== BENCHMARK SIMILARITY: {size:,} penyakit ===")
+
+    clock = time.perf_counter()
+    index = SimilarityIndex.build(synthetic_records(size))
+    print(f"Build indeks: {time.perf_counter() - clock:.2f} detik "
+          f"({len(index.vocabulary):,} term, {index.matrix.nnz:,} non-zero)")
+
+    clock = time.perf_counter()
+    index.similar_to('penyakit_0', k)
+    print(f"Query tunggal: {(time.perf_counter() - clock) * 1000:.1f} ms")
+
+    names = [f"penyakit_{i}" for i in range(min(queries, size))]
+    clock = time.perf_counter()
+    index.similar_to(names, k)
+    elapsed = time.perf_counter() - clock
+    print(f"Query batch {len(names):,}: {elapsed:.2f} detik ({len(names) / elapsed:,.0f} query/detik)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cari penyakit paling mirip lintas katalog")
+    parser.add_argument('names', nargs='*', help="Nama penyakit (nama_penyakit)")
+    parser.add_argument('-k', type=int, default=5)
+    parser.add_argument('--rebuild', action='store_true', help="Bangun ulang indeks dari JSON")
+    parser.add_argument('--benchmark', type=int, nargs='?', const=100_000,
+                        help="Benchmark pada N penyakit sintetis (default 100k)")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark, args.k)
+    else:
+        report_similar_diseases(args.names, args.k, args.rebuild)
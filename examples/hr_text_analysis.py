@@ -7,6 +7,7 @@ Contoh analisis teks untuk data HR (review karyawan dan log kehadiran)
 import re
 from collections import Counter, defaultdict
 from datetime import datetime
+import pandas as pd
 
 def parse_employee_reviews():
     """Parse dan analisis review karyawan"""
@@ -151,13 +152,8 @@ def extract_keywords(text_list):
     
     return Counter(all_words)
 
-def parse_attendance_log():
-    """Parse log kehadiran"""
-    print("\n=== ANALISIS LOG KEHADIRAN ===")
-    
-    with open('../hr/hr_attendance_log.txt', 'r', encoding='utf-8') as f:
-        content = f.read()
-    
+def parse_attendance_sections(content):
+    """Parse semua section kehadiran karyawan dari isi log (section yang gagal di-parse dilewati)"""
     # Split berdasarkan separator
     sections = content.split('=' * 40)
     
@@ -167,6 +163,18 @@ def parse_attendance_log():
             employee = parse_attendance_section(section)
             if employee:
                 employees.append(employee)
+    return employees
+
+def load_attendance_sections(log_file='../hr/hr_attendance_log.txt'):
+    """Baca file log kehadiran lalu parse semua section karyawan"""
+    with open(log_file, 'r', encoding='utf-8') as f:
+        return parse_attendance_sections(f.read())
+
+def parse_attendance_log():
+    """Parse log kehadiran"""
+    print("\n=== ANALISIS LOG KEHADIRAN ===")
+    
+    employees = load_attendance_sections()
     
     print(f"Total karyawan dalam log: {len(employees)}")
     
@@ -198,6 +206,7 @@ def parse_attendance_section(section):
     """Parse section kehadiran individual"""
     lines = section.strip().split('\n')
     employee = {
+        'id': None,
         'name': None,
         'department': None,
         'total_hours': 0,
@@ -212,10 +221,11 @@ def parse_attendance_section(section):
         line = line.strip()
         
         if line.startswith('EMPLOYEE:'):
-            # Extract name (before parentheses)
-            match = re.search(r'EMPLOYEE:\s*([^(]+)', line)
+            # Extract name (before parentheses) dan employee ID (di dalam parentheses)
+            match = re.search(r'EMPLOYEE:\s*([^(]+)(?:\((\w+)\))?', line)
             if match:
                 employee['name'] = match.group(1).strip()
+                employee['id'] = match.group(2)
         elif line.startswith('Department:'):
             employee['department'] = line.split(':')[1].strip()
         elif line.startswith('Total Hours Worked:'):
@@ -245,6 +255,22 @@ def parse_attendance_section(section):
     
     return employee if employee['name'] else None
 
+def join_reviews_attendance(employees_review, employees_attendance):
+    """Gabungkan review dan kehadiran berdasarkan employee ID (hash join via index)"""
+    reviews = pd.DataFrame(employees_review, columns=['id', 'name', 'department', 'rating'])
+    attendance = pd.DataFrame(employees_attendance,
+                              columns=['id', 'total_hours', 'overtime_hours', 'days_present',
+                                       'days_absent', 'late_arrivals', 'early_departures'])
+
+    reviews = reviews.dropna(subset=['id']).drop_duplicates('id', keep='last').set_index('id')
+    attendance = attendance.dropna(subset=['id']).drop_duplicates('id', keep='last').set_index('id')
+    return reviews.join(attendance, how='inner')
+
+def rating_correlations(combined):
+    """Korelasi rating dengan overtime dan keterlambatan (Pearson, vektor)"""
+    metrics = ['overtime_hours', 'late_arrivals', 'early_departures', 'days_absent']
+    return combined[metrics].astype(float).corrwith(combined['rating'].astype(float))
+
 def generate_hr_insights():
     """Generate insights dari data HR"""
     print("\n=== HR INSIGHTS ===")
@@ -279,6 +305,14 @@ def generate_hr_insights():
     print("\nArea improvement yang paling sering:")
     for improvement, count in common_improvements:
         print(f"- {improvement}: {count} karyawan")
+    
+    # Gabungkan review dan kehadiran berdasarkan employee ID
+    combined = join_reviews_attendance(employees_review, employees_attendance)
+    print(f"\nKaryawan dengan data review dan kehadiran: {len(combined)}")
+    if len(combined) > 1:
+        print("Korelasi rating dengan data kehadiran:")
+        for metric, corr in rating_correlations(combined).items():
+            print(f"- rating vs {metric}: {corr:+.2f}" if pd.notna(corr) else f"- rating vs {metric}: n/a")
 
 if __name__ == "__main__":
     # Jalankan semua analisis
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Multi-Keyword Matcher
+Tandai teks dengan kelas kata kunci (misalnya darurat, keganasan, infeksi,
+warna) memakai satu regex alternation ter-compile per kelas, sehingga scan
+multi-pattern berjalan di engine C modul re
+"""
+
+import re
+
+class KeywordMatcher:
+    """Satu pola `kata1|kata2|...` ter-compile per kelas, dibangun sekali per set kata kunci
+
+    keyword_classes: dict {nama_kelas: [kata kunci, ...]}. Pencocokan bersifat
+    substring dan case-insensitive, sama seperti `word in text.lower()`.
+    """
+
+    def __init__(self, keyword_classes):
+        self.classes = list(keyword_classes)
+        # Kata kunci terpanjang lebih dulu agar alternation tidak berhenti di prefiks
+        self._patterns = {
+            label: re.compile('|'.join(re.escape(keyword.lower())
+                                       for keyword in sorted(keywords, key=len, reverse=True)))
+            for label, keywords in keyword_classes.items()
+        }
+
+    @staticmethod
+    def _lower(texts):
+        """Gabungkan teks dengan newline (kata kunci tidak pernah memuat newline) lalu lowercase"""
+        return (texts[0] if len(texts) == 1 else '\n'.join(texts)).lower()
+
+    def matches(self, label, *texts):
+        """True jika kata kunci kelas `label` muncul di salah satu teks (hanya kelas itu yang di-scan)"""
+        return self._patterns[label].search(self._lower(texts)) is not None
+
+    def classify(self, *texts, classes=None):
+        """Kembalikan set kelas (dari `classes`, default semua) yang kata kuncinya muncul di salah satu teks"""
+        text = self._lower(texts)
+        return {label for label in (classes or self.classes) if self._patterns[label].search(text)}
+
+    def tag_all(self, texts, classes=None):
+        """Tandai banyak teks sekaligus: list of (teks, set kelas)
+
+        Lowercase dan search dijalankan lewat map() per kelas sehingga loop per teks tetap di C.
+        """
+        texts = list(texts)
+        lowered = list(map(str.lower, texts))
+        hits = {label: list(map(self._patterns[label].search, lowered))
+                for label in (classes or self.classes)}
+        return [(text, {label for label, found in hits.items() if found[i]})
+                for i, text in enumerate(texts)]
+
+if __name__ == "__main__":
+    matcher = KeywordMatcher({
+        'emergency': ['akut', 'mendadak', 'emergensi', 'kebutaan'],
+        'malignant': ['prakanker', 'kanker', 'ganas', 'keganasan'],
+        'infectious': ['infeksi', 'bakteri', 'virus', 'jamur', 'menular'],
+        'colour': ['putih', 'merah', 'hitam', 'kuning', 'coklat']
+    })
+
+    samples = [
+        "Infeksi virus akut yang dapat menyebabkan kebutaan",
+        "Lesi putih prakanker pada lidah",
+        "Bercak coklat kemerahan"
+    ]
+    for text, labels in matcher.tag_all(samples):
+        print(f"- {text}: {', '.join(sorted(labels)) or '-'}")
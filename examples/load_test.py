@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Report Server Load Test
+Uji beban report_server.py yang berjalan lokal: banyak koneksi keep-alive
+bersamaan, lalu laporkan throughput, latensi, dan statistik cache server
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from urllib.parse import urlsplit
+
+from report_server import ENDPOINTS
+
+async def fetch(reader, writer, host, path):
+    """Kirim satu GET lewat koneksi yang sama; kembalikan (status, body)"""
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: keep-alive\r\n\r\n".encode('latin-1'))
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+async def worker(host, port, paths, requests, latencies, errors):
+    """Satu klien: kirim `requests` request berurutan melalui satu koneksi"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for i in range(requests):
+            path = paths[i % len(paths)]
+            start = time.perf_counter()
+            status, _ = await fetch(reader, writer, host, path)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append((path, status))
+    finally:
+        writer.close()
+
+def percentile(values, fraction):
+    """Persentil sederhana dari list yang sudah diurutkan"""
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+async def run_load_test(url, concurrency, requests):
+    """Jalankan semua klien bersamaan dan tampilkan ringkasan"""
+    print(f"=== LOAD TEST {url} ===")
+    target = urlsplit(url)
+    host, port = target.hostname, target.port or 80
+    paths = sorted(ENDPOINTS)
+
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(host, port, paths[i % len(paths):] + paths[:i % len(paths)],
+                                  requests, latencies, errors)
+                           for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"Klien bersamaan: {concurrency}")
+    print(f"Total request: {len(latencies):,} ({len(errors)} error)")
+    print(f"Durasi: {elapsed:.2f} detik")
+    print(f"Throughput: {len(latencies) / elapsed:,.0f} request/detik")
+    print(f"Latensi p50: {percentile(latencies, 0.50) * 1000:.2f} ms")
+    print(f"Latensi p95: {percentile(latencies, 0.95) * 1000:.2f} ms")
+    print(f"Latensi p99: {percentile(latencies, 0.99) * 1000:.2f} ms")
+
+    reader, writer = await asyncio.open_connection(host, port)
+    _, body = await fetch(reader, writer, host, '/stats')
+    writer.close()
+    stats = json.loads(body)
+    print(f"Cache server: {stats['cache_hits']:,} hit, {stats['cache_misses']:,} miss")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test untuk report_server.py")
+    parser.add_argument('--url', default='http://127.0.0.1:8080')
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--requests', type=int, default=200, help="Request per klien")
+    args = parser.parse_args()
+
+    asyncio.run(run_load_test(args.url, args.concurrency, args.requests))
@@ -7,6 +7,15 @@ Contoh analisis lengkap untuk semua dataset medis dengan fokus pada ciri fisik
 import json
 from collections import Counter, defaultdict
 import re
+from keyword_matcher import KeywordMatcher
+
+# Satu regex ter-compile per kelas kata kunci, dipakai bersama oleh analisis mata, oral, dan kulit
+DISEASE_KEYWORDS = KeywordMatcher({
+    'emergency': ['akut', 'mendadak', 'emergensi', 'kebutaan'],
+    'malignant': ['prakanker', 'kanker', 'ganas', 'keganasan'],
+    'infectious': ['infeksi', 'bakteri', 'virus', 'jamur', 'menular'],
+    'colour': ['putih', 'merah', 'hitam', 'kuning', 'coklat']
+})
 
 def analyze_brain_diseases():
     """Analisis dataset penyakit otak/neurologis"""
@@ -54,11 +63,9 @@ def analyze_eye_diseases():
         print(f"- {cat}: {count} penyakit")
     
     # Ciri fisik mata yang mengancam penglihatan
-    emergency_signs = []
-    for disease in diseases:
-        if any(word in disease['deskripsi_singkat'].lower() 
-               for word in ['akut', 'mendadak', 'emergensi', 'kebutaan']):
-            emergency_signs.append(disease['nama_penyakit'])
+    descriptions = DISEASE_KEYWORDS.tag_all([d['deskripsi_singkat'] for d in diseases], ['emergency'])
+    emergency_signs = [disease['nama_penyakit'] for disease, (_, labels) in zip(diseases, descriptions)
+                       if labels]
     
     print(f"\nPenyakit mata yang memerlukan penanganan darurat: {len(emergency_signs)}")
     for disease in emergency_signs:
@@ -79,10 +86,10 @@ def analyze_oral_diseases():
         tongue_signs.extend(disease['ciri_fisik_lidah'])
     
     # Analisis perubahan warna lidah
-    color_changes = []
-    for sign in tongue_signs:
-        if any(color in sign.lower() for color in ['putih', 'merah', 'hitam', 'kuning', 'coklat']):
-            color_changes.append(sign)
+    # Ciri yang sama muncul di banyak penyakit: setiap ciri unik cukup ditandai sekali
+    sign_counts = Counter(tongue_signs)
+    colour_signs = {sign for sign, labels in DISEASE_KEYWORDS.tag_all(sign_counts, ['colour']) if labels}
+    color_changes = [sign for sign in tongue_signs if sign in colour_signs]
     
     print(f"\nPerubahan warna pada lidah: {len(color_changes)} manifestasi")
     color_counter = Counter(color_changes).most_common(3)
@@ -90,11 +97,9 @@ def analyze_oral_diseases():
         print(f"- {change}")
     
     # Penyakit dengan risiko keganasan
-    malignant_risk = []
-    for disease in diseases:
-        if any(word in disease['deskripsi_singkat'].lower() 
-               for word in ['prakanker', 'kanker', 'ganas', 'keganasan']):
-            malignant_risk.append(disease['nama_penyakit'])
+    descriptions = DISEASE_KEYWORDS.tag_all([d['deskripsi_singkat'] for d in diseases], ['malignant'])
+    malignant_risk = [disease['nama_penyakit'] for disease, (_, labels) in zip(diseases, descriptions)
+                      if labels]
     
     if malignant_risk:
         print(f"\nPenyakit dengan risiko keganasan:")
@@ -125,9 +130,11 @@ def analyze_skin_diseases():
     infectious = []
     non_infectious = []
     
-    for disease in diseases:
-        if any(word in disease['kategori'].lower() or word in disease['deskripsi_singkat'].lower()
-               for word in ['infeksi', 'bakteri', 'virus', 'jamur', 'menular']):
+    # Kategori dan deskripsi digabung newline: satu teks per penyakit, ditandai sekali
+    texts = DISEASE_KEYWORDS.tag_all([f"{d['kategori']}\n{d['deskripsi_singkat']}" for d in diseases],
+                                     ['infectious'])
+    for disease, (_, labels) in zip(diseases, texts):
+        if labels:
             infectious.append(disease['nama_penyakit'])
         else:
             non_infectious.append(disease['nama_penyakit'])
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Local Report Server
+Server HTTP asyncio (stdlib) yang memuat dataset IT, HR, dan healthcare sekali,
+lalu menyajikan hasil analisis sebagai endpoint JSON dengan cache LRU yang
+otomatis invalid saat file dataset berubah
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from datetime import date
+from collections import Counter, OrderedDict
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+from hr_text_analysis import (parse_single_review, load_attendance_sections,
+                              join_reviews_attendance, rating_correlations)
+from sign_clustering import DATASETS
+
+DATASET_FILES = {
+    'it_inventory': '../it/it_inventory.csv',
+    'software_licenses': '../it/software_licenses.json',
+    'employee_reviews': '../hr/employee_reviews.txt',
+    'attendance': '../hr/hr_attendance_log.txt',
+    'patients': '../healthcare/healthcare_patients.json',
+    **DATASETS
+}
+DISEASE_CATALOGUES = list(DATASETS)
+
+def load_json(path):
+    """Load file JSON"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def load_reviews(path):
+    """Load dan parse semua review karyawan"""
+    with open(path, 'r', encoding='utf-8') as f:
+        sections = f.read().split('=' * 80)
+    reviews = [parse_single_review(s) for s in sections if 'EMPLOYEE ID:' in s]
+    return [r for r in reviews if r]
+
+LOADERS = {
+    'it_inventory': lambda path: pd.read_csv(path, parse_dates=['warranty_expiry']),
+    'software_licenses': load_json,
+    'employee_reviews': load_reviews,
+    'attendance': load_attendance_sections,
+    'patients': load_json,
+    **{name: load_json for name in DISEASE_CATALOGUES}
+}
+
+class DataStore:
+    """Dataset di memori; dimuat ulang hanya jika mtime/ukuran file berubah
+
+    Parsing berjalan di thread terpisah dan dijaga lock per dataset, sehingga
+    request bersamaan menunggu satu parse yang sama, bukan parse ulang.
+    """
+
+    def __init__(self, files=DATASET_FILES):
+        self.files = files
+        self._data = {}
+        self._versions = {}
+        self._locks = {name: asyncio.Lock() for name in files}
+
+    def version(self, name):
+        """Versi file saat ini di disk (mtime, ukuran)"""
+        stat = os.stat(self.files[name])
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def loaded_version(self, name):
+        """Versi file yang sedang ada di memori"""
+        return self._versions.get(name)
+
+    async def get(self, name):
+        """Ambil dataset; parse ulang hanya jika file berubah sejak dimuat"""
+        current = self.version(name)
+        if self._versions.get(name) == current:
+            return self._data[name]
+
+        async with self._locks[name]:
+            current = self.version(name)
+            if self._versions.get(name) != current:
+                self._data[name] = await asyncio.to_thread(LOADERS[name], self.files[name])
+                self._versions[name] = current
+        return self._data[name]
+
+    async def load_all(self):
+        """Muat semua dataset secara paralel saat server start; dataset gagal dicoba lagi per request"""
+        results = await asyncio.gather(*(self.get(name) for name in self.files), return_exceptions=True)
+        for name, result in zip(self.files, results):
+            if isinstance(result, Exception):
+                print(f"Peringatan: dataset '{name}' gagal dimuat: {result}")
+
+class ResultCache:
+    """Cache LRU hasil endpoint; entry valid selama versi dataset sumbernya sama"""
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, versions):
+        """Ambil body dari cache, None jika tidak ada atau versi dataset sudah berubah"""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != versions:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key, versions, body):
+        """Simpan body dan buang entry paling lama tidak dipakai jika melebihi kapasitas"""
+        self._entries[key] = (versions, body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+def it_inventory_report(data, params):
+    """Distribusi aset IT per jenis, brand, status, dan departemen"""
+    df = data['it_inventory']
+    return {
+        'total_assets': len(df),
+        'asset_types': df['asset_type'].value_counts().to_dict(),
+        'top_brands': df['brand'].value_counts().head(5).to_dict(),
+        'status': df['status'].value_counts().to_dict(),
+        'departments': df['department'].value_counts().to_dict()
+    }
+
+def it_costs_report(data, params):
+    """Nilai aset total, biaya per jenis aset, dan aset termahal"""
+    df = data['it_inventory']
+    by_type = df.groupby('asset_type')['cost'].agg(['mean', 'count', 'sum'])
+    expensive = df.nlargest(5, 'cost')[['asset_id', 'asset_type', 'brand', 'model', 'cost']]
+    return {
+        'total_value': int(df['cost'].sum()),
+        'by_asset_type': {t: {'mean': float(r['mean']), 'count': int(r['count']), 'sum': int(r['sum'])}
+                          for t, r in by_type.iterrows()},
+        'most_expensive': expensive.to_dict(orient='records')
+    }
+
+def it_warranty_report(data, params):
+    """Aset dengan warranty habis dalam N bulan (param: months)"""
+    df = data['it_inventory']
+    months = int(params.get('months', 6))
+    limit = pd.Timestamp.now() + pd.DateOffset(months=months)
+    expiring = df[df['warranty_expiry'] <= limit]
+    return {
+        'months': months,
+        'expiring': [{'asset_id': a['asset_id'], 'brand': a['brand'], 'model': a['model'],
+                      'warranty_expiry': a['warranty_expiry'].strftime('%Y-%m-%d')}
+                     for _, a in expiring.iterrows()]
+    }
+
+def it_licenses_report(data, params):
+    """Biaya tahunan, utilisasi, dan status compliance lisensi software"""
+    licenses = data['software_licenses']
+    annual_cost = sum(l.get('total_annual_cost', l.get('total_cost', 0) / 5) for l in licenses)
+    utilization = {l['software_name']: round(l['used_licenses'] / l['total_licenses'] * 100, 1)
+                   for l in licenses}
+    return {
+        'total_licenses': len(licenses),
+        'annual_cost': annual_cost,
+        'utilization_percent': utilization,
+        'compliance_status': dict(Counter(l['compliance_status'] for l in licenses)),
+        'at_risk': [l['software_name'] for l in licenses if l.get('compliance_status') == 'At Risk']
+    }
+
+def hr_reviews_report(data, params):
+    """Ringkasan review karyawan: departemen, rating, rekomendasi"""
+    employees = data['employee_reviews']
+    ratings = [e['rating'] for e in employees if e['rating']]
+    return {
+        'total_reviews': len(employees),
+        'departments': dict(Counter(e['department'] for e in employees)),
+        'average_rating': sum(ratings) / len(ratings) if ratings else None,
+        'recommendations': dict(Counter(e['recommendation'] for e in employees if e['recommendation'])),
+        'high_performers': [{'id': e['id'], 'name': e['name'], 'rating': e['rating']}
+                            for e in employees if e['rating'] and e['rating'] >= 4.0]
+    }
+
+def hr_attendance_report(data, params):
+    """Ringkasan jam kerja, overtime tertinggi (param: top), dan keterlambatan"""
+    employees = data['attendance']
+    top = sorted(employees, key=lambda e: e['overtime_hours'], reverse=True)[:int(params.get('top', 3))]
+    return {
+        'total_employees': len(employees),
+        'total_hours': sum(e['total_hours'] for e in employees),
+        'total_overtime': sum(e['overtime_hours'] for e in employees),
+        'top_overtime': [{'id': e['id'], 'name': e['name'], 'overtime_hours': e['overtime_hours']}
+                         for e in top],
+        'late_arrivals': {e['name']: e['late_arrivals'] for e in employees if e['late_arrivals'] > 0}
+    }
+
+def hr_insights_report(data, params):
+    """Korelasi rating dengan data kehadiran berdasarkan employee ID"""
+    combined = join_reviews_attendance(data['employee_reviews'], data['attendance'])
+    correlations = rating_correlations(combined) if len(combined) > 1 else pd.Series(dtype=float)
+    return {
+        'joined_employees': len(combined),
+        'rating_correlations': {k: (None if pd.isna(v) else float(v)) for k, v in correlations.items()}
+    }
+
+def patients_report(data, params):
+    """Ringkasan pasien: umur, jenis kelamin, diagnosa, dan obat"""
+    patients = data['patients']
+    ages = [p['umur'] for p in patients]
+    return {
+        'total_patients': len(patients),
+        'average_age': sum(ages) / len(ages) if ages else None,
+        'gender': dict(Counter(p['jenis_kelamin'] for p in patients)),
+        'diagnoses': dict(Counter(p['diagnosa'] for p in patients)),
+        'medications': dict(Counter(m['nama_obat'] for p in patients for m in p['obat_yang_diminum']))
+    }
+
+def diseases_report(data, params):
+    """Ringkasan katalog penyakit (param: category)"""
+    catalogues = [params['category']] if 'category' in params else DISEASE_CATALOGUES
+    result = {}
+    for name in catalogues:
+        if name not in DISEASE_CATALOGUES:
+            raise KeyError(name)
+        diseases = data[name]
+        result[name] = {
+            'total': len(diseases),
+            'categories': dict(Counter(d['kategori'] for d in diseases)),
+            'diseases': [d['nama_penyakit'] for d in diseases]
+        }
+    return result
+
+# path -> (fungsi laporan, dataset yang dibutuhkan)
+ENDPOINTS = {
+    '/it/inventory': (it_inventory_report, ['it_inventory']),
+    '/it/costs': (it_costs_report, ['it_inventory']),
+    '/it/warranty': (it_warranty_report, ['it_inventory']),
+    '/it/licenses': (it_licenses_report, ['software_licenses']),
+    '/hr/reviews': (hr_reviews_report, ['employee_reviews']),
+    '/hr/attendance': (hr_attendance_report, ['attendance']),
+    '/hr/insights': (hr_insights_report, ['employee_reviews', 'attendance']),
+    '/healthcare/patients': (patients_report, ['patients']),
+    '/healthcare/diseases': (diseases_report, DISEASE_CATALOGUES)
+}
+# Endpoint yang hasilnya bergantung pada tanggal hari ini; cache juga invalid saat tanggal berganti
+DATE_RELATIVE_ENDPOINTS = {'/it/warranty'}
+
+class ReportServer:
+    """Server HTTP/1.1 minimal (keep-alive) di atas asyncio.start_server"""
+
+    def __init__(self, store=None, cache=None):
+        self.store = store or DataStore()
+        self.cache = cache or ResultCache()
+
+    async def handle_path(self, target):
+        """Jalankan endpoint untuk target URL; kembalikan (status, body)"""
+        url = urlsplit(target)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+        if url.path == '/':
+            return 200, {'endpoints': sorted(ENDPOINTS)}
+        if url.path == '/stats':
+            return 200, {'cache_hits': self.cache.hits, 'cache_misses': self.cache.misses}
+        if url.path not in ENDPOINTS:
+            return 404, {'error': f"endpoint tidak ditemukan: {url.path}"}
+
+        report, datasets = ENDPOINTS[url.path]
+        try:
+            data = {name: await self.store.get(name) for name in datasets}
+        except OSError as e:
+            return 503, {'error': f"dataset tidak tersedia: {e}"}
+        except ValueError as e:
+            # Termasuk JSONDecodeError / ParserError, misalnya file yang sedang ditulis
+            return 503, {'error': f"dataset tidak bisa di-parse: {e}"}
+        versions = tuple(self.store.loaded_version(name) for name in datasets)
+        if url.path in DATE_RELATIVE_ENDPOINTS:
+            versions += (date.today().isoformat(),)
+        key = (url.path, tuple(sorted(params.items())))
+
+        body = self.cache.get(key, versions)
+        if body is None:
+            try:
+                result = report(data, params)
+            except (KeyError, ValueError) as e:
+                return 400, {'error': f"parameter tidak valid: {e}"}
+            except Exception as e:
+                return 500, {'error': f"laporan gagal dibuat: {e}"}
+            body = json.dumps(result, ensure_ascii=False, default=str).encode('utf-8')
+            self.cache.put(key, versions, body)
+        return 200, body
+
+    async def handle_client(self, reader, writer):
+        """Layani satu koneksi; beberapa request berurutan didukung via keep-alive"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode('latin-1').split(' ', 2)
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                if method != 'GET':
+                    status, body = 405, {'error': 'hanya GET yang didukung'}
+                else:
+                    status, body = await self.handle_path(target)
+                if not isinstance(body, bytes):
+                    body = json.dumps(body, ensure_ascii=False).encode('utf-8')
+
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                reason = {200: 'OK', 400: 'Bad Request', 404: 'Not Found',
+                          405: 'Method Not Allowed', 500: 'Internal Server Error',
+                          503: 'Service Unavailable'}[status]
+                writer.write(
+                    f"HTTP/1.1 {status} {reason}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=8080):
+        """Muat dataset lalu jalankan server sampai dihentikan"""
+        await self.store.load_all()
+        server = await asyncio.start_server(self.handle_client, host, port)
+        print(f"Report server berjalan di http://{host}:{port}/ ({len(ENDPOINTS)} endpoint)")
+        async with server:
+            await server.serve_forever()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local JSON report server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--cache-size', type=int, default=256)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(ReportServer(cache=ResultCache(args.cache_size)).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\nReport server dihentikan")
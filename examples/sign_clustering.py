@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Physical Sign Clustering
+Deteksi ciri fisik yang mirip (bukan hanya identik) lintas katalog penyakit
+menggunakan MinHash character-shingle dan locality-sensitive hashing (LSH)
+"""
+
+import argparse
+import json
+import re
+import time
+from collections import defaultdict
+
+import numpy as np
+
+DATASETS = {
+    'brain': '../healthcare/brain_diseases.json',
+    'eye': '../healthcare/eye_diseases_detailed.json',
+    'oral': '../healthcare/tongue_oral_diseases.json',
+    'skin': '../healthcare/skin_diseases.json',
+    'general': '../healthcare/general_physical_examination.json'
+}
+
+def normalize_sign(sign):
+    """Normalisasi teks ciri fisik (lowercase, tanpa tanda baca, spasi tunggal)"""
+    clean = re.sub(r'[^\w\s]', ' ', sign.lower())
+    return ' '.join(clean.split())
+
+def load_physical_signs(datasets=DATASETS):
+    """Kumpulkan ciri fisik unik beserta daftar 'kategori:penyakit' yang memilikinya"""
+    physical_signs = defaultdict(list)
+
+    for category, file_path in datasets.items():
+        with open(file_path, 'r', encoding='utf-8') as f:
+            diseases = json.load(f)
+
+        for disease in diseases:
+            disease_name = disease['nama_penyakit']
+            for field, value in disease.items():
+                if ('ciri_fisik' in field or 'physical' in field) and isinstance(value, list):
+                    for sign in value:
+                        physical_signs[sign].append(f"{category}:{disease_name}")
+
+    return physical_signs
+
+def _hash_params(num_perm, seed):
+    """Parameter hash multiply-shift (a ganjil, b acak) untuk setiap permutasi"""
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+    return a, b
+
+def _mix64(x):
+    """Finalizer splitmix64 agar bit shingle tersebar merata"""
+    x = x ^ (x >> np.uint64(30))
+    x = x * np.uint64(0xbf58476d1ce4e5b9)
+    x = x ^ (x >> np.uint64(27))
+    x = x * np.uint64(0x94d049bb133111eb)
+    return x ^ (x >> np.uint64(31))
+
+def minhash_signatures(texts, num_perm=64, shingle_size=4, max_len=128,
+                       chunk_size=20000, seed=42):
+    """Hitung signature MinHash (n_texts x num_perm) secara vektor per chunk
+
+    Setiap teks di-encode UTF-8 ke matriks byte lebar tetap, shingle k-karakter
+    dikemas langsung menjadi uint64, lalu nilai minimum per fungsi hash diambil
+    sekaligus untuk seluruh baris dalam chunk.
+    """
+    if not 1 <= shingle_size <= 8:
+        raise ValueError("shingle_size harus antara 1 dan 8")
+
+    a, b = _hash_params(num_perm, seed)
+    n = len(texts)
+    signatures = np.empty((n, num_perm), dtype=np.uint64)
+
+    for start in range(0, n, chunk_size):
+        chunk = [t.encode('utf-8')[:max_len] for t in texts[start:start + chunk_size]]
+        lengths = np.fromiter((len(t) for t in chunk), dtype=np.int64, count=len(chunk))
+        width = max(int(lengths.max()), shingle_size)
+        raw = np.array(chunk, dtype=f'S{width}')
+        matrix = raw.view(np.uint8).reshape(len(chunk), width).astype(np.uint64)
+
+        n_shingles = width - shingle_size + 1
+        shingles = np.zeros((len(chunk), n_shingles), dtype=np.uint64)
+        for offset in range(shingle_size):
+            shingles |= matrix[:, offset:offset + n_shingles] << np.uint64(8 * offset)
+        shingles = _mix64(shingles)
+
+        # Posisi di luar teks diisi ulang dengan shingle pertama agar tidak mengubah minimum;
+        # teks lebih pendek dari shingle_size tetap punya satu shingle (posisi 0)
+        last_valid = np.maximum(lengths - shingle_size, 0)
+        invalid = np.arange(n_shingles)[None, :] > last_valid[:, None]
+        shingles = np.where(invalid, shingles[:, :1], shingles)
+
+        hashed = np.empty_like(shingles)
+        for p in range(num_perm):
+            np.multiply(shingles, a[p], out=hashed)
+            np.add(hashed, b[p], out=hashed)
+            hashed.min(axis=1, out=signatures[start:start + len(chunk), p])
+
+    return signatures
+
+def choose_bands(threshold, num_perm):
+    """Pilih (bands, rows) dengan titik belok (1/b)^(1/r) terdekat ke threshold"""
+    best = None
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        error = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+def lsh_candidate_pairs(signatures, bands, rows, window=8, seed=7):
+    """Kandidat pasangan dari bucket LSH (sources < targets)
+
+    Dalam setiap bucket, anggota dipasangkan dengan `window` tetangga berikutnya
+    dalam urutan sort: bucket berisi <= window + 1 anggota menghasilkan semua
+    pasangan, bucket yang lebih besar tetap memberi setiap anggota banyak
+    pasangan sehingga kegagalan verifikasi terhadap satu anggota tidak memutus cluster.
+    """
+    rng = np.random.default_rng(seed)
+    multipliers = rng.integers(1, 2**63, size=rows, dtype=np.uint64) | np.uint64(1)
+    sources, targets = [], []
+
+    for band in range(bands):
+        block = signatures[:, band * rows:(band + 1) * rows]
+        keys = _mix64((block * multipliers).sum(axis=1, dtype=np.uint64))
+
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        for offset in range(1, window + 1):
+            same = sorted_keys[offset:] == sorted_keys[:-offset]
+            if not same.any():
+                break
+            left, right = order[:-offset][same], order[offset:][same]
+            sources.append(np.minimum(left, right))
+            targets.append(np.maximum(left, right))
+
+    if not sources:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(sources), np.concatenate(targets)
+
+def connected_labels(n, sources, targets):
+    """Label komponen terhubung dengan propagasi minimum + pointer jumping"""
+    labels = np.arange(n)
+    if len(sources) == 0:
+        return labels
+
+    while True:
+        lowest = np.minimum(labels[sources], labels[targets])
+        updated = labels.copy()
+        np.minimum.at(updated, sources, lowest)
+        np.minimum.at(updated, targets, lowest)
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            return labels
+        labels = updated
+
+def _unique_signatures(texts, num_perm, shingle_size):
+    """Signature MinHash per teks unik (setelah normalisasi) + indeks teks -> teks unik"""
+    # Teks identik setelah normalisasi berbagi signature, cukup dihitung sekali
+    unique_index = {}
+    inverse = np.fromiter((unique_index.setdefault(normalize_sign(t), len(unique_index))
+                           for t in texts), dtype=np.int64, count=len(texts))
+    signatures = minhash_signatures(list(unique_index), num_perm=num_perm,
+                                    shingle_size=shingle_size)
+    return signatures, inverse
+
+def cluster_near_duplicates(texts, threshold=0.6, num_perm=64, shingle_size=4, timings=None):
+    """Kelompokkan teks mirip; kembalikan label cluster per teks
+
+    Kandidat dari LSH diverifikasi dengan estimasi Jaccard dari signature
+    sehingga hanya pasangan dengan kemiripan >= threshold yang digabung.
+    """
+    if not 0.0 < threshold <= 1.0:
+        raise ValueError("threshold harus di antara 0 dan 1")
+
+    clock = time.perf_counter()
+    signatures, inverse = _unique_signatures(texts, num_perm, shingle_size)
+    if timings is not None:
+        timings['minhash'] = time.perf_counter() - clock
+
+    clock = time.perf_counter()
+    bands, rows = choose_bands(threshold, num_perm)
+    sources, targets = lsh_candidate_pairs(signatures, bands, rows)
+    if len(sources):
+        n_unique = len(signatures)
+        pairs = np.unique(sources * n_unique + targets)
+        sources, targets = pairs // n_unique, pairs % n_unique
+        # Verifikasi per chunk agar salinan signature pasangan tidak memakan memori besar
+        required = int(np.ceil(threshold * num_perm))
+        keep = np.empty(len(sources), dtype=bool)
+        for start in range(0, len(sources), 65536):
+            chunk = slice(start, start + 65536)
+            matches = signatures[sources[chunk]] == signatures[targets[chunk]]
+            keep[chunk] = np.count_nonzero(matches, axis=1) >= required
+        sources, targets = sources[keep], targets[keep]
+    if timings is not None:
+        timings['lsh'] = time.perf_counter() - clock
+        timings['candidate_pairs'] = len(sources)
+
+    clock = time.perf_counter()
+    labels = connected_labels(len(signatures), sources, targets)[inverse]
+    if timings is not None:
+        timings['clustering'] = time.perf_counter() - clock
+    return labels
+
+def brute_force_labels(texts, threshold=0.6, num_perm=64, shingle_size=4, block_size=256):
+    """Label cluster dari verifikasi SEMUA pasangan signature (tanpa LSH), untuk cek akurasi
+
+    Biaya O(n^2), hanya untuk katalog kecil.
+    """
+    signatures, inverse = _unique_signatures(texts, num_perm, shingle_size)
+    sources, targets = [], []
+    for start in range(0, len(signatures), block_size):
+        block = signatures[start:start + block_size]
+        similarity = (block[:, None, :] == signatures[None, :, :]).mean(axis=2)
+        rows, columns = np.nonzero(similarity >= threshold)
+        rows += start
+        upper = rows < columns
+        sources.append(rows[upper])
+        targets.append(columns[upper])
+    return connected_labels(len(signatures), np.concatenate(sources), np.concatenate(targets))[inverse]
+
+def shared_sign_clusters(threshold=0.6, num_perm=64, datasets=DATASETS):
+    """Cluster ciri fisik mirip yang muncul di lebih dari satu kategori katalog"""
+    physical_signs = load_physical_signs(datasets)
+    signs = list(physical_signs)
+    labels = cluster_near_duplicates(signs, threshold=threshold, num_perm=num_perm)
+
+    clusters = defaultdict(list)
+    for sign, label in zip(signs, labels):
+        clusters[label].append(sign)
+
+    shared = []
+    for members in clusters.values():
+        diseases = sorted({d for sign in members for d in physical_signs[sign]})
+        categories = sorted({d.split(':', 1)[0] for d in diseases})
+        if len(categories) > 1:
+            shared.append({
+                'signs': sorted(members),
+                'categories': categories,
+                'diseases': diseases
+            })
+
+    shared.sort(key=lambda c: (len(c['categories']), len(c['diseases'])), reverse=True)
+    return shared
+
+def report_shared_clusters(threshold=0.6):
+    """Tampilkan cluster ciri fisik mirip lintas kategori"""
+    print(f"=== CLUSTER CIRI FISIK MIRIP LINTAS KATEGORI (threshold {threshold}) ===")
+
+    shared = shared_sign_clusters(threshold=threshold)
+    print(f"Cluster lintas kategori: {len(shared)}")
+
+    for cluster in shared[:10]:
+        print(f"\nKategori: {', '.join(cluster['categories'])}")
+        for sign in cluster['signs'][:3]:
+            print(f"  ~ '{sign}'")
+        for disease in cluster['diseases'][:5]:
+            category, name = disease.split(':', 1)
+            print(f"  - [{category}] {name}")
+
+    return shared
+
+def synthetic_catalogue(size, seed=0):
+    """Bangun katalog sintetis dari ciri fisik asli dengan variasi kata dan typo"""
+    rng = np.random.default_rng(seed)
+    base = [normalize_sign(s) for s in load_physical_signs()]
+    picks = rng.integers(0, len(base), size=size)
+    mutations = rng.integers(0, 4, size=size)
+    suffixes = rng.integers(0, 50000, size=size)
+
+    catalogue = []
+    for pick, mutation, suffix in zip(picks, mutations, suffixes):
+        words = base[pick].split()
+        if mutation == 1 and len(words) > 2:
+            del words[suffix % len(words)]
+        elif mutation == 2:
+            words.append(f"varian{suffix}")
+        elif mutation == 3 and words:
+            i = suffix % len(words)
+            words[i] = words[i][::-1]
+        catalogue.append(' '.join(words))
+    return catalogue
+
+def benchmark(size=1_000_000, threshold=0.6, num_perm=64):
+    """Benchmark MinHash/LSH pada katalog sintetis"""
+    print(f"=== BENCHMARK MINHASH/LSH: {size:,} ciri fisik ===")
+
+    clock = time.perf_counter()
+    catalogue = synthetic_catalogue(size)
+    print(f"Generate katalog sintetis: {time.perf_counter() - clock:.2f} detik")
+
+    timings = {}
+    clock = time.perf_counter()
+    labels = cluster_near_duplicates(catalogue, threshold=threshold,
+                                     num_perm=num_perm, timings=timings)
+    total = time.perf_counter() - clock
+
+    print(f"MinHash signature: {timings['minhash']:.2f} detik")
+    print(f"LSH + verifikasi: {timings['lsh']:.2f} detik ({timings['candidate_pairs']:,} pasangan)")
+    print(f"Clustering: {timings['clustering']:.2f} detik")
+    print(f"Total: {total:.2f} detik ({size / total:,.0f} ciri/detik)")
+    print(f"Jumlah cluster: {len(np.unique(labels)):,}")
+
+    # Akurasi LSH dibanding verifikasi semua pasangan pada katalog kecil
+    sample = catalogue[:min(size, 5000)]
+    lsh_clusters = len(np.unique(cluster_near_duplicates(sample, threshold=threshold, num_perm=num_perm)))
+    exact_clusters = len(np.unique(brute_force_labels(sample, threshold=threshold, num_perm=num_perm)))
+    print(f"Cek brute force ({len(sample):,} ciri): LSH {lsh_clusters:,} cluster, "
+          f"semua pasangan {exact_clusters:,} cluster")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Near-duplicate physical sign clustering")
+    parser.add_argument('--threshold', type=float, default=0.6,
+                        help="Estimasi Jaccard minimum agar dua ciri dianggap mirip")
+    parser.add_argument('--benchmark', type=int, nargs='?', const=1_000_000,
+                        help="Jalankan benchmark pada N ciri sintetis (default 1M)")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(size=args.benchmark, threshold=args.threshold)
+    else:
+        report_shared_clusters(threshold=args.threshold)
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+SQLite Dataset Store
+Import semua dataset (CSV, JSON, TXT) ke satu database SQLite berindeks, lalu
+jalankan analisis lewat query SQL sehingga pertanyaan selektif memakai indeks
+tanpa memuat seluruh dataset
+"""
+
+import argparse
+import csv
+import json
+import sqlite3
+
+from hr_text_analysis import parse_single_review, parse_attendance_sections
+from attendance_events import parse_attendance_events
+from sign_clustering import DATASETS
+
+DB_FILE = 'datasets.db'
+IT_INVENTORY = '../it/it_inventory.csv'
+SOFTWARE_LICENSES = '../it/software_licenses.json'
+EMPLOYEE_REVIEWS = '../hr/employee_reviews.txt'
+ATTENDANCE_LOG = '../hr/hr_attendance_log.txt'
+PATIENTS = '../healthcare/healthcare_patients.json'
+
+SCHEMA = """
+CREATE TABLE it_inventory (
+    asset_id TEXT PRIMARY KEY, asset_type TEXT, brand TEXT, model TEXT, serial_number TEXT,
+    purchase_date TEXT, warranty_expiry TEXT, status TEXT, location TEXT, assigned_to TEXT,
+    department TEXT, specifications TEXT, cost INTEGER
+);
+CREATE INDEX idx_it_department ON it_inventory(department);
+CREATE INDEX idx_it_asset_type ON it_inventory(asset_type, cost);
+CREATE INDEX idx_it_warranty_expiry ON it_inventory(warranty_expiry);
+CREATE INDEX idx_it_cost ON it_inventory(cost);
+
+CREATE TABLE software_licenses (
+    license_id TEXT PRIMARY KEY, software_name TEXT, vendor TEXT, license_type TEXT,
+    total_licenses INTEGER, used_licenses INTEGER, available_licenses INTEGER,
+    cost_per_license REAL, total_annual_cost REAL, total_cost REAL,
+    purchase_date TEXT, renewal_date TEXT, status TEXT, compliance_status TEXT, notes TEXT
+);
+CREATE INDEX idx_license_compliance ON software_licenses(compliance_status);
+
+CREATE TABLE employee_reviews (
+    employee_id TEXT PRIMARY KEY, name TEXT, position TEXT, department TEXT,
+    rating REAL, recommendation TEXT
+);
+CREATE INDEX idx_review_department ON employee_reviews(department);
+CREATE INDEX idx_review_rating ON employee_reviews(rating);
+
+CREATE TABLE review_items (employee_id TEXT, section TEXT, item TEXT);
+CREATE INDEX idx_review_items ON review_items(section, employee_id);
+
+CREATE TABLE attendance (
+    employee_id TEXT, name TEXT, department TEXT, total_hours INTEGER, overtime_hours INTEGER,
+    days_present INTEGER, days_absent INTEGER, late_arrivals INTEGER, early_departures INTEGER
+);
+CREATE INDEX idx_attendance_employee ON attendance(employee_id);
+CREATE INDEX idx_attendance_department ON attendance(department);
+CREATE INDEX idx_attendance_overtime ON attendance(overtime_hours);
+
+CREATE TABLE attendance_events (
+    employee_id TEXT, department TEXT, date TEXT, minutes INTEGER, kind TEXT, reason TEXT
+);
+CREATE INDEX idx_events_kind_date ON attendance_events(kind, date);
+CREATE INDEX idx_events_employee ON attendance_events(employee_id, date);
+
+CREATE TABLE patients (
+    patient_id TEXT PRIMARY KEY, nama TEXT, umur INTEGER, jenis_kelamin TEXT, alamat TEXT,
+    diagnosa TEXT, tanggal_kunjungan TEXT, status TEXT, detail TEXT
+);
+CREATE INDEX idx_patients_diagnosa ON patients(diagnosa);
+
+CREATE TABLE patient_medications (patient_id TEXT, nama_obat TEXT, dosis TEXT, frekuensi TEXT);
+CREATE INDEX idx_medications_nama_obat ON patient_medications(nama_obat);
+CREATE INDEX idx_medications_patient ON patient_medications(patient_id);
+
+CREATE TABLE diseases (
+    catalogue TEXT, disease_id INTEGER, nama_penyakit TEXT, kategori TEXT,
+    deskripsi_singkat TEXT, detail TEXT,
+    PRIMARY KEY (catalogue, disease_id)
+);
+CREATE INDEX idx_diseases_kategori ON diseases(kategori);
+CREATE INDEX idx_diseases_nama ON diseases(nama_penyakit);
+
+CREATE TABLE disease_signs (catalogue TEXT, disease_id INTEGER, field TEXT, sign TEXT);
+CREATE INDEX idx_signs_sign ON disease_signs(sign);
+CREATE INDEX idx_signs_field ON disease_signs(field);
+CREATE INDEX idx_signs_disease ON disease_signs(catalogue, disease_id);
+"""
+
+def connect(db_path=DB_FILE):
+    """Buka koneksi dengan row sebagai sqlite3.Row (akses kolom by name)"""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+def import_it(conn):
+    """Import inventaris IT (CSV) dan lisensi software (JSON)"""
+    with open(IT_INVENTORY, 'r', encoding='utf-8', newline='') as f:
+        rows = [(r['asset_id'], r['asset_type'], r['brand'], r['model'], r['serial_number'],
+                 r['purchase_date'], r['warranty_expiry'], r['status'], r['location'],
+                 r['assigned_to'], r['department'], r['specifications'], int(r['cost']))
+                for r in csv.DictReader(f)]
+    conn.executemany("INSERT INTO it_inventory VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)", rows)
+
+    with open(SOFTWARE_LICENSES, 'r', encoding='utf-8') as f:
+        licenses = json.load(f)
+    conn.executemany(
+        "INSERT INTO software_licenses VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)",
+        [(l['license_id'], l['software_name'], l.get('vendor'), l.get('license_type'),
+          l['total_licenses'], l['used_licenses'], l.get('available_licenses'),
+          l.get('cost_per_license'), l.get('total_annual_cost'), l.get('total_cost'),
+          l.get('purchase_date'), l.get('renewal_date'), l.get('status'),
+          l.get('compliance_status'), l.get('notes')) for l in licenses])
+    return len(rows), len(licenses)
+
+def import_hr(conn):
+    """Import review karyawan dan log kehadiran (termasuk event per tanggal)"""
+    with open(EMPLOYEE_REVIEWS, 'r', encoding='utf-8') as f:
+        reviews = [parse_single_review(s) for s in f.read().split('=' * 80) if 'EMPLOYEE ID:' in s]
+    # Satu baris per employee ID: review terakhir yang menang (sama dengan keep='last' di
+    # join_reviews_attendance), review_items ikut dari review yang dipertahankan
+    reviews = list({r['id']: r for r in reviews if r}.values())
+    conn.executemany("INSERT OR REPLACE INTO employee_reviews VALUES (?,?,?,?,?,?)",
+                     [(r['id'], r['name'], r['position'], r['department'], r['rating'],
+                       r['recommendation']) for r in reviews])
+    conn.executemany("INSERT INTO review_items VALUES (?,?,?)",
+                     [(r['id'], section, item) for r in reviews
+                      for section in ('strengths', 'improvements', 'goals') for item in r[section]])
+
+    with open(ATTENDANCE_LOG, 'r', encoding='utf-8') as f:
+        content = f.read()
+    attendance = parse_attendance_sections(content)
+    conn.executemany("INSERT INTO attendance VALUES (?,?,?,?,?,?,?,?,?)",
+                     [(a['id'], a['name'], a['department'], a['total_hours'], a['overtime_hours'],
+                       a['days_present'], a['days_absent'], a['late_arrivals'],
+                       a['early_departures']) for a in attendance])
+
+    events = parse_attendance_events(content)
+    conn.executemany("INSERT INTO attendance_events VALUES (?,?,?,?,?,?)",
+                     zip(events['employee_id'], events['department'], events['date'],
+                         events['minutes'], events['kind'], events['reason']))
+    return len(reviews), len(attendance), len(events['date'])
+
+def import_healthcare(conn):
+    """Import data pasien, obat, dan semua katalog penyakit beserta ciri fisiknya"""
+    with open(PATIENTS, 'r', encoding='utf-8') as f:
+        patients = json.load(f)
+    base_fields = ['patient_id', 'nama', 'umur', 'jenis_kelamin', 'alamat', 'diagnosa',
+                   'tanggal_kunjungan', 'status']
+    conn.executemany("INSERT INTO patients VALUES (?,?,?,?,?,?,?,?,?)",
+                     [tuple(p.get(k) for k in base_fields) +
+                      (json.dumps({k: v for k, v in p.items() if k not in base_fields},
+                                  ensure_ascii=False),) for p in patients])
+    conn.executemany("INSERT INTO patient_medications VALUES (?,?,?,?)",
+                     [(p['patient_id'], m['nama_obat'], m.get('dosis'), m.get('frekuensi'))
+                      for p in patients for m in p['obat_yang_diminum']])
+
+    total_diseases = 0
+    for catalogue, file_path in DATASETS.items():
+        with open(file_path, 'r', encoding='utf-8') as f:
+            diseases = json.load(f)
+        total_diseases += len(diseases)
+        conn.executemany("INSERT INTO diseases VALUES (?,?,?,?,?,?)",
+                         [(catalogue, d['id'], d['nama_penyakit'], d['kategori'],
+                           d['deskripsi_singkat'], json.dumps(d, ensure_ascii=False))
+                          for d in diseases])
+        conn.executemany("INSERT INTO disease_signs VALUES (?,?,?,?)",
+                         [(catalogue, d['id'], field, item) for d in diseases
+                          for field, value in d.items() if isinstance(value, list)
+                          for item in value if isinstance(item, str)])
+    return len(patients), total_diseases
+
+def build_database(db_path=DB_FILE):
+    """Buat ulang database dari semua file dataset"""
+    conn = connect(db_path)
+    with conn:
+        tables = [r['name'] for r in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'")]
+        for table in tables:
+            conn.execute(f"DROP TABLE {table}")
+        conn.executescript(SCHEMA)
+
+    with conn:
+        assets, licenses = import_it(conn)
+        reviews, attendance, events = import_hr(conn)
+        patients, diseases = import_healthcare(conn)
+    conn.execute("ANALYZE")
+    conn.close()
+
+    print(f"=== IMPORT KE {db_path} ===")
+    print(f"- Aset IT: {assets}, lisensi software: {licenses}")
+    print(f"- Review karyawan: {reviews}, kehadiran: {attendance}, event kehadiran: {events}")
+    print(f"- Pasien: {patients}, penyakit: {diseases}")
+
+def asset_type_distribution(conn, department=None):
+    """Jumlah aset per jenis, opsional difilter per departemen (pakai idx_it_department)"""
+    if department:
+        return conn.execute("SELECT asset_type, COUNT(*) AS count FROM it_inventory "
+                            "WHERE department = ? GROUP BY asset_type ORDER BY count DESC",
+                            (department,)).fetchall()
+    return conn.execute("SELECT asset_type, COUNT(*) AS count FROM it_inventory "
+                        "GROUP BY asset_type ORDER BY count DESC").fetchall()
+
+def asset_costs_by_type(conn, asset_type=None):
+    """Rata-rata, jumlah, dan total biaya per jenis aset"""
+    query = ("SELECT asset_type, AVG(cost) AS mean, COUNT(*) AS count, SUM(cost) AS total "
+             "FROM it_inventory {} GROUP BY asset_type")
+    if asset_type:
+        return conn.execute(query.format("WHERE asset_type = ?"), (asset_type,)).fetchall()
+    return conn.execute(query.format("")).fetchall()
+
+def most_expensive_assets(conn, limit=5):
+    """Aset termahal (scan mundur pada idx_it_cost)"""
+    return conn.execute("SELECT asset_id, asset_type, brand, model, cost FROM it_inventory "
+                        "ORDER BY cost DESC LIMIT ?", (limit,)).fetchall()
+
+def expiring_warranties(conn, months=6):
+    """Aset dengan warranty habis dalam N bulan (range scan pada idx_it_warranty_expiry)"""
+    return conn.execute("SELECT asset_id, brand, model, warranty_expiry FROM it_inventory "
+                        "WHERE warranty_expiry <= date('now', ?) ORDER BY warranty_expiry",
+                        (f'+{int(months)} months',)).fetchall()
+
+def license_utilization(conn, min_percent=0):
+    """Utilisasi lisensi (%) dengan batas minimum, misalnya 90 untuk utilisasi tinggi"""
+    return conn.execute("SELECT software_name, used_licenses, total_licenses, available_licenses, "
+                        "100.0 * used_licenses / total_licenses AS utilization "
+                        "FROM software_licenses WHERE 100.0 * used_licenses / total_licenses > ? "
+                        "ORDER BY utilization DESC", (min_percent,)).fetchall()
+
+def licenses_by_compliance(conn, status='At Risk'):
+    """Lisensi dengan status compliance tertentu (pakai idx_license_compliance)"""
+    return conn.execute("SELECT software_name, notes FROM software_licenses "
+                        "WHERE compliance_status = ?", (status,)).fetchall()
+
+def rating_by_department(conn):
+    """Rating rata-rata per departemen"""
+    return conn.execute("SELECT department, AVG(rating) AS rating, COUNT(*) AS count "
+                        "FROM employee_reviews WHERE rating IS NOT NULL "
+                        "GROUP BY department ORDER BY rating DESC").fetchall()
+
+def high_performers(conn, min_rating=4.0):
+    """Karyawan dengan rating >= min_rating (range scan pada idx_review_rating)"""
+    return conn.execute("SELECT employee_id, name, department, rating FROM employee_reviews "
+                        "WHERE rating >= ? ORDER BY rating DESC", (min_rating,)).fetchall()
+
+def top_overtime(conn, limit=3):
+    """Karyawan dengan overtime tertinggi (scan mundur pada idx_attendance_overtime)"""
+    return conn.execute("SELECT employee_id, name, department, overtime_hours FROM attendance "
+                        "ORDER BY overtime_hours DESC LIMIT ?", (limit,)).fetchall()
+
+def late_events(conn, start=None, end=None):
+    """Total menit terlambat per karyawan dalam rentang tanggal (pakai idx_events_kind_date)"""
+    return conn.execute("SELECT employee_id, department, COUNT(*) AS count, SUM(minutes) AS minutes "
+                        "FROM attendance_events WHERE kind = 'late' "
+                        "AND date >= COALESCE(?, '0000-01-01') AND date <= COALESCE(?, '9999-12-31') "
+                        "GROUP BY employee_id ORDER BY minutes DESC", (start, end)).fetchall()
+
+def patients_by_diagnosis(conn, diagnosa):
+    """Pasien dengan diagnosa tertentu (pakai idx_patients_diagnosa)"""
+    return conn.execute("SELECT patient_id, nama, umur, jenis_kelamin FROM patients "
+                        "WHERE diagnosa = ?", (diagnosa,)).fetchall()
+
+def medication_counts(conn):
+    """Obat yang paling sering diresepkan"""
+    return conn.execute("SELECT nama_obat, COUNT(DISTINCT patient_id) AS patients "
+                        "FROM patient_medications GROUP BY nama_obat "
+                        "ORDER BY patients DESC, nama_obat").fetchall()
+
+def patients_on_medication(conn, nama_obat):
+    """Pasien yang meminum obat tertentu (pakai idx_medications_nama_obat)"""
+    return conn.execute("SELECT p.patient_id, p.nama, p.diagnosa, m.dosis, m.frekuensi "
+                        "FROM patient_medications m JOIN patients p USING (patient_id) "
+                        "WHERE m.nama_obat = ?", (nama_obat,)).fetchall()
+
+def diseases_with_sign(conn, sign):
+    """Penyakit yang memiliki ciri fisik persis sama (pakai idx_signs_sign)"""
+    return conn.execute("SELECT s.catalogue, d.nama_penyakit, d.kategori, s.field "
+                        "FROM disease_signs s JOIN diseases d "
+                        "ON d.catalogue = s.catalogue AND d.disease_id = s.disease_id "
+                        "WHERE s.sign = ?", (sign,)).fetchall()
+
+def shared_physical_signs(conn, limit=5):
+    """Ciri fisik yang muncul pada lebih dari satu penyakit"""
+    return conn.execute("SELECT sign, COUNT(*) AS diseases FROM disease_signs "
+                        "WHERE field LIKE 'ciri_fisik%' GROUP BY sign HAVING COUNT(*) > 1 "
+                        "ORDER BY diseases DESC LIMIT ?", (limit,)).fetchall()
+
+def generate_sql_report(db_path=DB_FILE):
+    """Tampilkan laporan ringkas yang setara dengan script analisis lain, lewat SQL"""
+    conn = connect(db_path)
+
+    print("=== LAPORAN DARI SQLITE ===")
+    print("\nDistribusi jenis aset:")
+    for row in asset_type_distribution(conn):
+        print(f"- {row['asset_type']}: {row['count']} unit")
+
+    print("\nAset termahal:")
+    for row in most_expensive_assets(conn):
+        print(f"- {row['asset_id']}: {row['brand']} {row['model']} - Rp {row['cost']:,}")
+
+    print("\nAset dengan warranty habis dalam 6 bulan:")
+    for row in expiring_warranties(conn):
+        print(f"- {row['asset_id']}: {row['brand']} {row['model']} - Expired: {row['warranty_expiry']}")
+
+    print("\nSoftware dengan utilisasi tinggi (>90%):")
+    for row in license_utilization(conn, 90):
+        print(f"- {row['software_name']}: {row['utilization']:.1f}% (sisa {row['available_licenses']} lisensi)")
+
+    print("\nRating rata-rata per departemen:")
+    for row in rating_by_department(conn):
+        print(f"- {row['department']}: {row['rating']:.2f}/5.0")
+
+    print("\nKaryawan dengan overtime tertinggi:")
+    for row in top_overtime(conn):
+        print(f"- {row['name']} ({row['department']}): {row['overtime_hours']} jam")
+
+    print("\nObat yang paling sering diresepkan:")
+    for row in medication_counts(conn):
+        print(f"- {row['nama_obat']}: {row['patients']} pasien")
+
+    print("\nCiri fisik yang muncul pada multiple penyakit:")
+    for row in shared_physical_signs(conn):
+        print(f"- {row['sign']}: {row['diseases']} penyakit")
+
+    conn.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SQLite store untuk semua dataset")
+    parser.add_argument('command', choices=['import', 'report'])
+    parser.add_argument('--db', default=DB_FILE)
+    args = parser.parse_args()
+
+    if args.command == 'import':
+        build_database(args.db)
+    else:
+        generate_sql_report(args.db)